@@ -2,9 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from app.models import (
-    Provider, Patient, ProviderAvailability, AppointmentSlot, Appointment,
-    AvailabilityStatus, AppointmentStatus, PaymentStatus
+    Provider, Patient, ProviderAvailability, AppointmentSlot, Appointment
 )
+from app.enums import AvailabilityStatus, AppointmentStatus, PaymentStatus
 from app.schemas import ProviderCreate, PatientCreate
 from app.security import get_password_hash
 from typing import Optional, List, Dict, Any
@@ -289,6 +289,11 @@ def update_patient_medical_history(
 
 
 # Provider Availability CRUD operations
+def _minutes_from_midnight(hhmm: str) -> int:
+    """Convert an HH:mm string to minutes from midnight"""
+    return int(hhmm[:2]) * 60 + int(hhmm[3:5])
+
+
 def create_provider_availability(
     db: Session, 
     provider_id: str, 
@@ -304,22 +309,24 @@ def create_provider_availability(
             detail="Provider not found"
         )
     
-    # Convert times to datetime objects for conflict detection
-    start_datetime = datetime.combine(availability_data['date'], time.fromisoformat(availability_data['start_time']))
-    end_datetime = datetime.combine(availability_data['date'], time.fromisoformat(availability_data['end_time']))
-    
+    # Conflict detection on integer minutes: the query pins every candidate
+    # to the same date, so HH:mm strings map straight to minutes-from-midnight
+    # and the overlap check is two int compares instead of datetime math
+    new_start = _minutes_from_midnight(availability_data['start_time'])
+    new_end = _minutes_from_midnight(availability_data['end_time'])
+
     # Check for overlapping availability slots
     existing_conflicts = db.query(ProviderAvailability).filter(
         ProviderAvailability.provider_id == provider_id,
         ProviderAvailability.date == availability_data['date'],
         ProviderAvailability.status.in_([AvailabilityStatus.AVAILABLE, AvailabilityStatus.BOOKED])
     ).all()
-    
+
     for existing in existing_conflicts:
-        existing_start = datetime.combine(existing.date, time.fromisoformat(existing.start_time))
-        existing_end = datetime.combine(existing.date, time.fromisoformat(existing.end_time))
-        
-        if (start_datetime < existing_end and end_datetime > existing_start):
+        existing_start = _minutes_from_midnight(existing.start_time)
+        existing_end = _minutes_from_midnight(existing.end_time)
+
+        if (new_start < existing_end and new_end > existing_start):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Time slot conflicts with existing availability: {existing.start_time}-{existing.end_time}"
@@ -340,11 +347,15 @@ def create_provider_availability(
                 detail="Invalid recurrence pattern"
             )
         
-        dates_to_create = list(rrule.rrule(
-            rule,
-            dtstart=availability_data['date'],
-            until=availability_data['recurrence_end_date']
-        ))
+        # rrule yields datetimes; keep plain dates so the Date column and
+        # the reported date_range stay date-only
+        dates_to_create = [
+            occurrence.date() for occurrence in rrule.rrule(
+                rule,
+                dtstart=availability_data['date'],
+                until=availability_data['recurrence_end_date']
+            )
+        ]
     else:
         dates_to_create = [availability_data['date']]
     
@@ -411,7 +422,9 @@ def create_provider_availability(
         "slots_created": total_slots_created,
         "date_range": {
             "start": min(dates_to_create).isoformat(),
-            "end": max(dates_to_create).isoformat()
+            # Report the requested range: a weekly recurrence may end days
+            # before the recurrence_end_date itself
+            "end": (availability_data.get('recurrence_end_date') or max(dates_to_create)).isoformat()
         },
         "total_appointments_available": total_slots_created
     }
@@ -425,56 +438,42 @@ def generate_appointment_slots(
 ) -> int:
     """Generate appointment slots for a given availability"""
     
+    if slots_count <= 0:
+        return 0
+
     # Parse timezone
     try:
         tz = pytz.timezone(timezone_str)
     except pytz.exceptions.UnknownTimeZoneError:
         tz = pytz.UTC
-    
-    # Calculate slot times
+
     start_time = time.fromisoformat(availability.start_time)
-    slot_duration = availability.slot_duration
-    break_duration = availability.break_duration
-    
-    slots_created = 0
-    
-    for i in range(slots_count):
-        # Calculate slot start time
-        slot_start_minutes = start_time.hour * 60 + start_time.minute + i * (slot_duration + break_duration)
-        slot_start_hour = slot_start_minutes // 60
-        slot_start_minute = slot_start_minutes % 60
-        
-        # Calculate slot end time
-        slot_end_minutes = slot_start_minutes + slot_duration
-        slot_end_hour = slot_end_minutes // 60
-        slot_end_minute = slot_end_minutes % 60
-        
-        # Create datetime objects with timezone
-        slot_start_dt = datetime.combine(availability.date, time(slot_start_hour, slot_start_minute))
-        slot_end_dt = datetime.combine(availability.date, time(slot_end_hour, slot_end_minute))
-        
-        # Localize to timezone
-        slot_start_dt = tz.localize(slot_start_dt)
-        slot_end_dt = tz.localize(slot_end_dt)
-        
-        # Convert to UTC for storage
-        slot_start_utc = slot_start_dt.astimezone(pytz.UTC)
-        slot_end_utc = slot_end_dt.astimezone(pytz.UTC)
-        
-        # Create appointment slot
-        appointment_slot = AppointmentSlot(
-            availability_id=availability.id,
-            provider_id=availability.provider_id,
-            slot_start_time=slot_start_utc,
-            slot_end_time=slot_end_utc,
-            status=AvailabilityStatus.AVAILABLE,
-            appointment_type=availability.appointment_type.value
-        )
-        
-        db.add(appointment_slot)
-        slots_created += 1
-    
-    return slots_created
+    slot_length = timedelta(minutes=availability.slot_duration)
+    step = timedelta(minutes=availability.slot_duration + availability.break_duration)
+
+    # Localize the day's first slot once and step in UTC from there; every
+    # other boundary is plain timedelta arithmetic instead of a per-slot
+    # combine/localize/astimezone round-trip
+    day_start_utc = tz.localize(
+        datetime.combine(availability.date, start_time)
+    ).astimezone(pytz.UTC)
+    slot_starts = [day_start_utc + i * step for i in range(slots_count)]
+
+    # One multi-row INSERT instead of a flush per ORM object
+    db.bulk_insert_mappings(AppointmentSlot, [
+        {
+            "id": str(uuid.uuid4()),
+            "availability_id": availability.id,
+            "provider_id": availability.provider_id,
+            "slot_start_time": slot_start,
+            "slot_end_time": slot_start + slot_length,
+            "status": AvailabilityStatus.AVAILABLE,
+            "appointment_type": availability.appointment_type.value
+        }
+        for slot_start in slot_starts
+    ])
+
+    return slots_count
 
 
 def get_provider_availability(
@@ -657,10 +656,10 @@ def search_availability(
         query = query.filter(AppointmentSlot.appointment_type == search_criteria["appointment_type"])
     
     if search_criteria.get("insurance_accepted") is not None:
-        query = query.filter(ProviderAvailability.pricing['insurance_accepted'].astext == str(search_criteria["insurance_accepted"]).lower())
+        query = query.filter(ProviderAvailability.pricing['insurance_accepted'].as_boolean() == search_criteria["insurance_accepted"])
     
     if search_criteria.get("max_price"):
-        query = query.filter(ProviderAvailability.pricing['base_fee'].astext.cast(float) <= search_criteria["max_price"])
+        query = query.filter(ProviderAvailability.pricing['base_fee'].as_float() <= search_criteria["max_price"])
     
     # Execute query
     slots = query.all()
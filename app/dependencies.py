@@ -1,11 +1,33 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.security import verify_token, verify_token_enhanced
 from app.crud import get_provider_by_email, get_patient_by_email
 
-security = HTTPBearer()
+
+class BearerAuth(HTTPBearer):
+    """HTTPBearer that reports missing/malformed credentials as 401.
+
+    The stock class raises 403, but an absent token is an authentication
+    failure, not an authorization one, and callers expect 401 with a
+    WWW-Authenticate challenge.
+    """
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials:
+        try:
+            return await super().__call__(request)
+        except HTTPException as exc:
+            if exc.status_code == status.HTTP_403_FORBIDDEN:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Not authenticated",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            raise
+
+
+security = BearerAuth()
 
 
 def get_current_provider(
@@ -0,0 +1,60 @@
+import enum
+
+
+class VerificationStatus(str, enum.Enum):
+    PENDING = "pending"
+    VERIFIED = "verified"
+    REJECTED = "rejected"
+
+
+class Gender(str, enum.Enum):
+    MALE = "male"
+    FEMALE = "female"
+    OTHER = "other"
+    PREFER_NOT_TO_SAY = "prefer_not_to_say"
+
+
+class RecurrencePattern(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class AvailabilityStatus(str, enum.Enum):
+    AVAILABLE = "available"
+    BOOKED = "booked"
+    CANCELLED = "cancelled"
+    BLOCKED = "blocked"
+    MAINTENANCE = "maintenance"
+
+
+class AppointmentType(str, enum.Enum):
+    CONSULTATION = "consultation"
+    FOLLOW_UP = "follow_up"
+    EMERGENCY = "emergency"
+    TELEMEDICINE = "telemedicine"
+
+
+class LocationType(str, enum.Enum):
+    CLINIC = "clinic"
+    HOSPITAL = "hospital"
+    TELEMEDICINE = "telemedicine"
+    HOME_VISIT = "home_visit"
+
+
+class AppointmentStatus(str, enum.Enum):
+    SCHEDULED = "scheduled"
+    CONFIRMED = "confirmed"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    NO_SHOW = "no_show"
+    RESCHEDULED = "rescheduled"
+
+
+class PaymentStatus(str, enum.Enum):
+    PENDING = "pending"
+    PAID = "paid"
+    PARTIAL = "partial"
+    REFUNDED = "refunded"
+    CANCELLED = "cancelled"
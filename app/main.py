@@ -1,7 +1,8 @@
 import os
 from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.config import settings
 from app.database import engine, Base, recreate_engine
 from app.routers import auth, providers, patients, availability, appointments
@@ -21,7 +22,8 @@ app = FastAPI(
     description="A secure, scalable backend system for healthcare provider registration and appointment management",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -65,6 +67,26 @@ async def http_exception_handler(request, exc):
     )
 
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc):
+    """Shape request validation failures like the in-handler validation
+    errors: a success flag plus field -> messages, instead of FastAPI's
+    raw error list."""
+    errors = {}
+    for error in exc.errors():
+        location = [str(part) for part in error["loc"] if part != "body"]
+        field = location[0] if location else "unknown"
+        errors.setdefault(field, []).append(error["msg"])
+    return JSONResponse(
+        status_code=422,
+        content={
+            "success": False,
+            "message": "Validation failed",
+            "errors": errors
+        }
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -1,70 +1,32 @@
 from sqlalchemy import Column, String, Integer, Boolean, DateTime, Enum, Date, ForeignKey, Numeric, Text
 from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import enum
 import uuid
 import os
 from app.database import Base
+from app.enums import (
+    VerificationStatus, Gender, RecurrencePattern, AvailabilityStatus,
+    AppointmentType, LocationType, AppointmentStatus, PaymentStatus
+)
 
 
-class VerificationStatus(str, enum.Enum):
-    PENDING = "pending"
-    VERIFIED = "verified"
-    REJECTED = "rejected"
+class StringUUID(TypeDecorator):
+    """String(36) storage that accepts uuid.UUID values.
 
+    SQLite cannot bind uuid.UUID objects, so values coming from the
+    column defaults (uuid.uuid4) are coerced to their string form on the
+    way in; strings pass through untouched.
+    """
 
-class Gender(str, enum.Enum):
-    MALE = "male"
-    FEMALE = "female"
-    OTHER = "other"
-    PREFER_NOT_TO_SAY = "prefer_not_to_say"
+    impl = String(36)
+    cache_ok = True
 
-
-class RecurrencePattern(str, enum.Enum):
-    DAILY = "daily"
-    WEEKLY = "weekly"
-    MONTHLY = "monthly"
-
-
-class AvailabilityStatus(str, enum.Enum):
-    AVAILABLE = "available"
-    BOOKED = "booked"
-    CANCELLED = "cancelled"
-    BLOCKED = "blocked"
-    MAINTENANCE = "maintenance"
-
-
-class AppointmentType(str, enum.Enum):
-    CONSULTATION = "consultation"
-    FOLLOW_UP = "follow_up"
-    EMERGENCY = "emergency"
-    TELEMEDICINE = "telemedicine"
-
-
-class LocationType(str, enum.Enum):
-    CLINIC = "clinic"
-    HOSPITAL = "hospital"
-    TELEMEDICINE = "telemedicine"
-    HOME_VISIT = "home_visit"
-
-
-class AppointmentStatus(str, enum.Enum):
-    SCHEDULED = "scheduled"
-    CONFIRMED = "confirmed"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-    NO_SHOW = "no_show"
-    RESCHEDULED = "rescheduled"
-
-
-class PaymentStatus(str, enum.Enum):
-    PENDING = "pending"
-    PAID = "paid"
-    PARTIAL = "partial"
-    REFUNDED = "refunded"
-    CANCELLED = "cancelled"
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return value
 
 
 # Helper function to determine UUID type based on database
@@ -72,7 +34,7 @@ def get_uuid_type():
     """Return appropriate UUID type based on database"""
     database_url = os.getenv("DATABASE_URL", "")
     if "sqlite" in database_url.lower():
-        return String(36)  # SQLite doesn't support UUID natively
+        return StringUUID()  # SQLite doesn't support UUID natively
     else:
         return UUID(as_uuid=True)  # PostgreSQL supports UUID
 
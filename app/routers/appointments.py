@@ -26,7 +26,7 @@ from app.crud import (
     get_provider_by_id
 )
 from app.dependencies import get_current_active_patient, get_current_active_provider
-from app.models import AppointmentStatus
+from app.enums import AppointmentStatus
 
 router = APIRouter(tags=["Appointments"])
 
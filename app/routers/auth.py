@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.schemas import ProviderCreate, ProviderResponse, Token, ProviderLogin, LoginResponse
+from app.schemas import ProviderCreate, ProviderLogin
 from app.crud import create_provider, get_provider_by_email
 from app.security import authenticate_provider, create_access_token, create_provider_access_token
 from datetime import timedelta
@@ -11,7 +12,31 @@ from app.config import settings
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
-@router.post("/register", response_model=ProviderResponse, status_code=status.HTTP_201_CREATED)
+def _provider_payload(provider):
+    """Build the provider response dict, omitting credential fields.
+
+    Returning this through ORJSONResponse skips the response_model
+    re-validation and jsonable_encoder passes on the hot registration path;
+    orjson serializes the datetime and enum fields natively.
+    """
+    return {
+        "id": str(provider.id),
+        "first_name": provider.first_name,
+        "last_name": provider.last_name,
+        "email": provider.email,
+        "phone_number": provider.phone_number,
+        "specialization": provider.specialization,
+        "license_number": provider.license_number,
+        "years_of_experience": provider.years_of_experience,
+        "clinic_address": provider.clinic_address,
+        "verification_status": provider.verification_status,
+        "is_active": provider.is_active,
+        "created_at": provider.created_at,
+        "updated_at": provider.updated_at
+    }
+
+
+@router.post("/register", status_code=status.HTTP_201_CREATED)
 def register_provider(
     provider: ProviderCreate,
     db: Session = Depends(get_db)
@@ -31,7 +56,10 @@ def register_provider(
     """
     try:
         db_provider = create_provider(db=db, provider=provider)
-        return db_provider
+        return ORJSONResponse(
+            content=_provider_payload(db_provider),
+            status_code=status.HTTP_201_CREATED
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -41,7 +69,7 @@ def register_provider(
         )
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login")
 def login_provider_oauth(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
@@ -71,10 +99,10 @@ def login_provider_oauth(
         data={"sub": provider.email}, expires_delta=access_token_expires
     )
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    return ORJSONResponse({"access_token": access_token, "token_type": "bearer"})
 
 
-@router.post("/provider/login", response_model=LoginResponse)
+@router.post("/provider/login")
 def login_provider(
     login_data: ProviderLogin,
     db: Session = Depends(get_db)
@@ -137,13 +165,15 @@ def login_provider(
         "updated_at": provider.updated_at.isoformat()
     }
     
-    return LoginResponse(
-        success=True,
-        message="Login successful",
-        data={
+    # Serialize the already-validated dict directly; re-running it through
+    # the LoginResponse model would only repeat validation work
+    return ORJSONResponse({
+        "success": True,
+        "message": "Login successful",
+        "data": {
             "access_token": access_token,
             "expires_in": 3600,  # 1 hour in seconds
             "token_type": "Bearer",
             "provider": provider_data
         }
-    ) 
\ No newline at end of file
+    })
\ No newline at end of file
@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas import (
+    ProviderAvailabilityCreate,
     ProviderAvailabilityUpdate,
     AvailabilityCreateResponse,
     AvailabilityResponse,
     AvailabilitySearchRequest,
-    AvailabilitySearchResponse
+    AvailabilitySearchResponse,
+    AvailabilitySearchResponseWrapper
 )
 from app.crud import (
     create_provider_availability,
@@ -28,7 +30,7 @@ router = APIRouter(prefix="/provider", tags=["provider-availability"])
 
 @router.post("/availability", response_model=AvailabilityCreateResponse, status_code=status.HTTP_201_CREATED)
 def create_availability_slots(
-    availability_data: dict,
+    availability_data: ProviderAvailabilityCreate,
     db: Session = Depends(get_db),
     current_provider = Depends(get_current_active_provider)
 ):
@@ -52,7 +54,7 @@ def create_availability_slots(
         result = create_provider_availability(
             db=db,
             provider_id=str(current_provider.id),
-            availability_data=availability_data
+            availability_data=availability_data.dict()
         )
         
         return AvailabilityCreateResponse(
@@ -245,7 +247,7 @@ def delete_availability_slot_endpoint(
         )
 
 
-@router.get("/availability/search", response_model=AvailabilitySearchResponse)
+@router.get("/availability/search", response_model=AvailabilitySearchResponseWrapper)
 def search_availability_endpoint(
     date: Optional[date] = Query(None, description="Specific date to search"),
     start_date: Optional[date] = Query(None, description="Start date for range search"),
@@ -310,7 +312,7 @@ def search_availability_endpoint(
             search_criteria=search_criteria
         )
         
-        return AvailabilitySearchResponse(
+        return AvailabilitySearchResponseWrapper(
             success=True,
             data=result
         )
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas import (
-    PatientCreate, 
-    PatientResponse, 
-    PatientLogin, 
-    LoginResponse, 
+    PatientCreate,
+    PatientResponse,
+    PatientLogin,
     Token,
     PatientRegistrationResponse,
     ValidationErrorResponse
@@ -92,7 +92,7 @@ def register_patient(
         )
 
 
-@router.post("/login", response_model=LoginResponse)
+@router.post("/login")
 def login_patient(
     login_data: PatientLogin,
     db: Session = Depends(get_db)
@@ -158,16 +158,18 @@ def login_patient(
         "updated_at": patient.updated_at.isoformat()
     }
     
-    return LoginResponse(
-        success=True,
-        message="Login successful",
-        data={
+    # Serialize the already-validated dict directly; re-running it through
+    # the LoginResponse model would only repeat validation work
+    return ORJSONResponse({
+        "success": True,
+        "message": "Login successful",
+        "data": {
             "access_token": access_token,
             "expires_in": 1800,  # 30 minutes in seconds
             "token_type": "Bearer",
             "patient": patient_data
         }
-    )
+    })
 
 
 @router.post("/login/oauth", response_model=Token)
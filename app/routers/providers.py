@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.schemas import ProviderResponse
+from app.schemas import ProviderResponse, ProviderVerificationUpdate
 from app.crud import get_provider_by_id, update_provider_verification_status
 from app.dependencies import get_current_active_provider
-from app.models import Provider, VerificationStatus
+from app.models import Provider
+from app.enums import VerificationStatus
 from typing import List
 
 router = APIRouter(prefix="/providers", tags=["providers"])
@@ -20,6 +21,22 @@ def get_current_provider_profile(
     return current_provider
 
 
+@router.get("/pending-verification", response_model=List[ProviderResponse])
+def get_pending_verification_providers(
+    db: Session = Depends(get_db),
+    current_provider: Provider = Depends(get_current_active_provider)
+):
+    """
+    Get all providers pending verification (admin only)
+    """
+    # In a real application, you would check if current_provider has admin privileges
+    pending_providers = db.query(Provider).filter(
+        Provider.verification_status == VerificationStatus.PENDING
+    ).all()
+    
+    return pending_providers
+
+
 @router.get("/{provider_id}", response_model=ProviderResponse)
 def get_provider_by_id_endpoint(
     provider_id: str,
@@ -41,7 +58,7 @@ def get_provider_by_id_endpoint(
 @router.put("/{provider_id}/verify", response_model=ProviderResponse)
 def verify_provider(
     provider_id: str,
-    verification_status: VerificationStatus,
+    verification_update: ProviderVerificationUpdate,
     db: Session = Depends(get_db),
     current_provider: Provider = Depends(get_current_active_provider)
 ):
@@ -51,7 +68,7 @@ def verify_provider(
     # In a real application, you would check if current_provider has admin privileges
     # For now, we'll allow any authenticated provider to update verification status
     
-    provider = update_provider_verification_status(db, provider_id, verification_status)
+    provider = update_provider_verification_status(db, provider_id, verification_update.verification_status)
     if not provider:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,19 +76,3 @@ def verify_provider(
         )
     
     return provider
-
-
-@router.get("/pending-verification", response_model=List[ProviderResponse])
-def get_pending_verification_providers(
-    db: Session = Depends(get_db),
-    current_provider: Provider = Depends(get_current_active_provider)
-):
-    """
-    Get all providers pending verification (admin only)
-    """
-    # In a real application, you would check if current_provider has admin privileges
-    pending_providers = db.query(Provider).filter(
-        Provider.verification_status == VerificationStatus.PENDING
-    ).all()
-    
-    return pending_providers 
\ No newline at end of file
@@ -1,13 +1,28 @@
 from pydantic import BaseModel, EmailStr, validator, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date, time
+from datetime import date as date_type
 import re
-from app.models import (
-    VerificationStatus, Gender, RecurrencePattern, AvailabilityStatus, 
+from app.enums import (
+    VerificationStatus, Gender, RecurrencePattern, AvailabilityStatus,
     AppointmentType, LocationType, AppointmentStatus, PaymentStatus
 )
 
 
+# Validator patterns, compiled once at import; these run on every request
+# payload that passes through the schemas below
+_ZIP_RE = re.compile(r'^\d{5}(-\d{4})?$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_CURRENCY_RE = re.compile(r'^[A-Z]{3}$')
+_TIME_RE = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+_LOWERCASE_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_ALPHANUMERIC_RE = re.compile(r'^[A-Za-z0-9]+$')
+
+
 class ClinicAddress(BaseModel):
     street: str = Field(..., max_length=200, description="Street address")
     city: str = Field(..., max_length=100, description="City")
@@ -17,7 +32,7 @@ class ClinicAddress(BaseModel):
     @validator('zip')
     def validate_zip(cls, v):
         # Basic ZIP validation (US format)
-        if not re.match(r'^\d{5}(-\d{4})?$', v):
+        if not _ZIP_RE.match(v):
             raise ValueError('Invalid ZIP code format')
         return v
 
@@ -31,7 +46,7 @@ class PatientAddress(BaseModel):
     @validator('zip')
     def validate_zip(cls, v):
         # Basic ZIP validation (US format)
-        if not re.match(r'^\d{5}(-\d{4})?$', v):
+        if not _ZIP_RE.match(v):
             raise ValueError('Invalid ZIP code format')
         return v
 
@@ -44,7 +59,7 @@ class EmergencyContact(BaseModel):
     @validator('phone')
     def validate_phone(cls, v):
         """Validate international phone number format"""
-        digits_only = re.sub(r'\D', '', v)
+        digits_only = _NON_DIGIT_RE.sub('', v)
         if len(digits_only) < 10 or len(digits_only) > 15:
             raise ValueError('Phone number must be between 10-15 digits')
         return v
@@ -75,66 +90,54 @@ class PricingInfo(BaseModel):
 
     @validator('currency')
     def validate_currency(cls, v):
-        if not re.match(r'^[A-Z]{3}$', v):
+        if not _CURRENCY_RE.match(v):
             raise ValueError('Currency must be a 3-letter ISO code')
         return v
 
 
-# Temporarily commented out to fix import issues
-# class ProviderAvailabilityCreate(BaseModel):
-#     date: date = Field(..., description="Availability date")
-#     start_time: str = Field(..., description="Start time in HH:mm format")
-#     end_time: str = Field(..., description="End time in HH:mm format")
-#     timezone: str = Field(..., description="Timezone (e.g., America/New_York)")
-#     slot_duration: int = Field(30, ge=15, le=120, description="Slot duration in minutes")
-#     break_duration: int = Field(0, ge=0, le=60, description="Break duration in minutes")
-#     is_recurring: bool = Field(False, description="Whether this is a recurring availability")
-#     recurrence_pattern: Optional[RecurrencePattern] = Field(None, description="Recurrence pattern")
-#     recurrence_end_date: Optional[date] = None
-#     appointment_type: AppointmentType = Field(AppointmentType.CONSULTATION, description="Type of appointment")
-#     location: LocationInfo = Field(..., description="Location information")
-#     pricing: Optional[PricingInfo] = Field(None, description="Pricing information")
-#     special_requirements: Optional[List[str]] = Field(None, description="Special requirements")
-#     notes: Optional[str] = Field(None, max_length=500, description="Additional notes")
-#     max_appointments_per_slot: int = Field(1, ge=1, le=10, description="Maximum appointments per slot")
-# 
-#     @validator('start_time', 'end_time')
-#     def validate_time_format(cls, v):
-#         """Validate time format HH:mm"""
-#         if not re.match(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$', v):
-#             raise ValueError('Time must be in HH:mm format (24-hour)')
-#         return v
-# 
-#     @validator('end_time')
-#     def validate_end_time_after_start_time(cls, v, values):
-#         """Validate end time is after start time"""
-#         if 'start_time' in values:
-#             start_time = time.fromisoformat(values['start_time'])
-#             end_time = time.fromisoformat(v)
-#             if end_time <= start_time:
-#                 raise ValueError('End time must be after start time')
-#         return v
-# 
-#     @validator('recurrence_end_date')
-#     def validate_recurrence_end_date(cls, v, values):
-#         """Validate recurrence end date is after start date"""
-#         if v and 'date' in values:
-#             if v <= values['date']:
-#                 raise ValueError('Recurrence end date must be after start date')
-#         return v
-# 
-#     @validator('timezone')
-#     def validate_timezone(cls, v):
-#         """Basic timezone validation"""
-#         valid_timezones = [
-#             'America/New_York', 'America/Chicago', 'America/Denver', 'America/Los_Angeles',
-#             'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Australia/Sydney',
-#             'UTC', 'GMT'
-#         ]
-#         if v not in valid_timezones:
-#             # Allow other timezones but log warning
-#             pass
-#         return v
+class ProviderAvailabilityCreate(BaseModel):
+    # The field is named `date`, which shadows the datetime type inside the
+    # class body, so the date-typed annotations here use the module alias
+    date: date_type = Field(..., description="Availability date")
+    start_time: str = Field(..., description="Start time in HH:mm format")
+    end_time: str = Field(..., description="End time in HH:mm format")
+    timezone: str = Field(..., description="Timezone (e.g., America/New_York)")
+    slot_duration: int = Field(30, ge=15, le=120, description="Slot duration in minutes")
+    break_duration: int = Field(0, ge=0, le=60, description="Break duration in minutes")
+    is_recurring: bool = Field(False, description="Whether this is a recurring availability")
+    recurrence_pattern: Optional[RecurrencePattern] = Field(None, description="Recurrence pattern")
+    recurrence_end_date: Optional[date_type] = None
+    appointment_type: AppointmentType = Field(AppointmentType.CONSULTATION, description="Type of appointment")
+    location: LocationInfo = Field(..., description="Location information")
+    pricing: Optional[PricingInfo] = Field(None, description="Pricing information")
+    special_requirements: Optional[List[str]] = Field(None, description="Special requirements")
+    notes: Optional[str] = Field(None, max_length=500, description="Additional notes")
+    max_appointments_per_slot: int = Field(1, ge=1, le=10, description="Maximum appointments per slot")
+
+    @validator('start_time', 'end_time')
+    def validate_time_format(cls, v):
+        """Validate time format HH:mm"""
+        if not _TIME_RE.match(v):
+            raise ValueError('Time must be in HH:mm format (24-hour)')
+        return v
+
+    @validator('end_time')
+    def validate_end_time_after_start_time(cls, v, values):
+        """Validate end time is after start time"""
+        if 'start_time' in values:
+            start_time = time.fromisoformat(values['start_time'])
+            end_time = time.fromisoformat(v)
+            if end_time <= start_time:
+                raise ValueError('End time must be after start time')
+        return v
+
+    @validator('recurrence_end_date')
+    def validate_recurrence_end_date(cls, v, values):
+        """Validate recurrence end date is after start date"""
+        if v and 'date' in values:
+            if v <= values['date']:
+                raise ValueError('Recurrence end date must be after start date')
+        return v
 
 
 class ProviderAvailabilityUpdate(BaseModel):
@@ -148,7 +151,7 @@ class ProviderAvailabilityUpdate(BaseModel):
     @validator('start_time', 'end_time')
     def validate_time_format(cls, v):
         """Validate time format HH:mm"""
-        if v and not re.match(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$', v):
+        if v and not _TIME_RE.match(v):
             raise ValueError('Time must be in HH:mm format (24-hour)')
         return v
 
@@ -257,7 +260,7 @@ class AppointmentCreate(BaseModel):
     def validate_contact_phone(cls, v):
         """Validate phone number format"""
         if v:
-            digits_only = re.sub(r'\D', '', v)
+            digits_only = _NON_DIGIT_RE.sub('', v)
             if len(digits_only) < 10 or len(digits_only) > 15:
                 raise ValueError('Phone number must be between 10-15 digits')
         return v
@@ -265,7 +268,7 @@ class AppointmentCreate(BaseModel):
     @validator('contact_email')
     def validate_contact_email(cls, v):
         """Validate email format"""
-        if v and not re.match(r'^[^@]+@[^@]+\.[^@]+$', v):
+        if v and not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v
 
@@ -376,13 +379,13 @@ class ProviderCreate(BaseModel):
         """Validate password complexity requirements"""
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not _DIGIT_RE.search(v):
             raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError('Password must contain at least one special character')
         return v
 
@@ -390,7 +393,7 @@ class ProviderCreate(BaseModel):
     def validate_phone(cls, v):
         """Validate international phone number format"""
         # Remove all non-digit characters for validation
-        digits_only = re.sub(r'\D', '', v)
+        digits_only = _NON_DIGIT_RE.sub('', v)
         if len(digits_only) < 10 or len(digits_only) > 15:
             raise ValueError('Phone number must be between 10-15 digits')
         return v
@@ -398,7 +401,7 @@ class ProviderCreate(BaseModel):
     @validator('license_number')
     def validate_license(cls, v):
         """Validate license number format (alphanumeric)"""
-        if not re.match(r'^[A-Za-z0-9]+$', v):
+        if not _ALPHANUMERIC_RE.match(v):
             raise ValueError('License number must be alphanumeric')
         return v
 
@@ -422,13 +425,13 @@ class PatientCreate(BaseModel):
         """Validate password complexity requirements"""
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not _DIGIT_RE.search(v):
             raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError('Password must contain at least one special character')
         return v
 
@@ -442,7 +445,7 @@ class PatientCreate(BaseModel):
     @validator('phone_number')
     def validate_phone(cls, v):
         """Validate international phone number format"""
-        digits_only = re.sub(r'\D', '', v)
+        digits_only = _NON_DIGIT_RE.sub('', v)
         if len(digits_only) < 10 or len(digits_only) > 15:
             raise ValueError('Phone number must be between 10-15 digits')
         return v
@@ -484,6 +487,10 @@ class ProviderResponse(BaseModel):
         from_attributes = True
 
 
+class ProviderVerificationUpdate(BaseModel):
+    verification_status: VerificationStatus
+
+
 class PatientResponse(BaseModel):
     id: str
     first_name: str
@@ -10,9 +10,12 @@ This script demonstrates the complete appointment booking workflow:
 5. Manage appointments (view, update, cancel, reschedule)
 """
 
-import requests
+import asyncio
+import logging
+import orjson
+import httpx
 import json
-import time
+import os
 from datetime import datetime, date, timedelta
 from typing import Dict, Any
 
@@ -20,67 +23,144 @@ from typing import Dict, Any
 BASE_URL = "http://localhost:8001"
 API_PREFIX = "/api/v1"
 
-def print_response(response: requests.Response, title: str):
-    """Print formatted response"""
-    print(f"\n{'='*50}")
-    print(f"{title}")
-    print(f"{'='*50}")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print(f"{'='*50}\n")
-
-def test_provider_registration_and_login() -> str:
-    """Register a provider and login to get JWT token"""
-    print("🔧 Registering provider...")
-    
-    provider_data = {
-        "first_name": "Dr. Sarah",
-        "last_name": "Johnson",
-        "email": "sarah.johnson@clinic.com",
-        "phone_number": "+1234567890",
-        "password": "SecurePass123!",
-        "specialization": "Cardiology",
-        "license_number": "MD789012",
-        "years_of_experience": 15,
-        "clinic_address": {
-            "street": "456 Medical Center Blvd",
-            "city": "Boston",
-            "state": "MA",
-            "zip": "02108"
-        }
+# Endpoint paths are known at import time and resolved against the client's
+# base_url, so build them once instead of re-evaluating f-strings per call
+AUTH_REGISTER_URL = "/auth/register"
+PROVIDER_LOGIN_URL = "/provider/login"
+PATIENT_REGISTER_URL = "/patient/register"
+PATIENT_LOGIN_URL = "/patient/login"
+AVAILABILITY_URL = "/provider/availability"
+AVAILABILITY_SEARCH_URL = f"{AVAILABILITY_URL}/search"
+APPOINTMENTS_URL = "/appointments"
+PROVIDER_APPOINTMENTS_URL = "/provider/appointments"
+PUBLIC_APPOINTMENTS_URL = "/public/appointments"
+
+def appointment_url(appointment_id: str) -> str:
+    return f"{APPOINTMENTS_URL}/{appointment_id}"
+
+def appointment_cancel_url(appointment_id: str) -> str:
+    return f"{APPOINTMENTS_URL}/{appointment_id}/cancel"
+
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+# Full pretty-printed bodies only when explicitly requested; the default
+# path logs a one-line status and skips the indent-2 re-serialization
+VERBOSE = os.environ.get("DEMO_VERBOSE") == "1"
+
+logging.basicConfig(level=logging.DEBUG if VERBOSE else logging.INFO, format="%(message)s")
+log = logging.getLogger("appointment_demo")
+
+class _LazyJSON:
+    """Defer pretty-printing to the moment a handler actually emits it"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def __str__(self):
+        return json.dumps(self.body, indent=2)
+
+def make_client(token: str = None) -> httpx.AsyncClient:
+    """Create a pooled async client; pass a token for an authenticated actor"""
+    headers = dict(JSON_HEADERS)
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    # Retry transient connection failures on the warm connection instead of
+    # letting one reset abort the whole demo run
+    transport = httpx.AsyncHTTPTransport(retries=3)
+    return httpx.AsyncClient(
+        base_url=BASE_URL + API_PREFIX,
+        headers=headers,
+        timeout=10.0,
+        transport=transport
+    )
+
+# Parsed appointment records by id so back-to-back steps reuse the booking
+# response instead of re-fetching the same record
+APPOINTMENT_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Static payloads, serialized once with orjson so calls skip the per-request
+# json.dumps path (Content-Type is already on the clients)
+PROVIDER_DATA = {
+    "first_name": "Dr. Sarah",
+    "last_name": "Johnson",
+    "email": "sarah.johnson@clinic.com",
+    "phone_number": "+1234567890",
+    "password": "SecurePass123!",
+    "specialization": "Cardiology",
+    "license_number": "MD789012",
+    "years_of_experience": 15,
+    "clinic_address": {
+        "street": "456 Medical Center Blvd",
+        "city": "Boston",
+        "state": "MA",
+        "zip": "02108"
     }
-    
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/auth/register", json=provider_data)
-    print_response(response, "Provider Registration")
-    
-    if response.status_code != 201:
-        print("❌ Provider registration failed")
-        return None
-    
-    # Login to get JWT token
-    print("🔑 Logging in provider...")
-    login_data = {
-        "email": "sarah.johnson@clinic.com",
-        "password": "SecurePass123!"
+}
+PROVIDER_DATA_BYTES = orjson.dumps(PROVIDER_DATA)
+PROVIDER_LOGIN_BYTES = orjson.dumps({
+    "email": "sarah.johnson@clinic.com",
+    "password": "SecurePass123!"
+})
+
+PATIENT_DATA = {
+    "first_name": "John",
+    "last_name": "Smith",
+    "email": "john.smith@email.com",
+    "phone_number": "+1987654321",
+    "password": "SecurePass123!",
+    "confirm_password": "SecurePass123!",
+    "date_of_birth": "1985-06-15",
+    "gender": "male",
+    "address": {
+        "street": "123 Main Street",
+        "city": "Boston",
+        "state": "MA",
+        "zip": "02101"
+    },
+    "emergency_contact": {
+        "name": "Jane Smith",
+        "phone": "+1987654322",
+        "relationship": "spouse"
+    },
+    "insurance_info": {
+        "provider": "Blue Cross Blue Shield",
+        "policy_number": "BCBS123456789"
     }
-    
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/provider/login", json=login_data)
-    print_response(response, "Provider Login")
-    
-    if response.status_code != 200:
-        print("❌ Provider login failed")
+}
+PATIENT_DATA_BYTES = orjson.dumps(PATIENT_DATA)
+PATIENT_LOGIN_BYTES = orjson.dumps({
+    "email": "john.smith@email.com",
+    "password": "SecurePass123!"
+})
+
+def print_response(response: httpx.Response, title: str, body: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Log the response and return the parsed body (parsed once)"""
+    if body is None:
+        # orjson skips the per-call encoding detection in response.json()
+        body = orjson.loads(response.content)
+    log.info("%s: %s (%dB)", title, response.status_code, len(response.content))
+    # The pretty-print only runs when the DEBUG handler actually emits
+    log.debug("body=%s", _LazyJSON(body))
+    return body
+
+def _ok(response: httpx.Response, title: str, expect: int = 200):
+    """Success fast path: one orjson parse, one dict lookup, no pretty-print.
+
+    On the expected status this logs a single status line and returns the
+    response's data payload; anything else falls back to the verbose path.
+    """
+    if response.status_code != expect:
+        print_response(response, title + " [FAIL]")
         return None
-    
-    token = response.json()["data"]["access_token"]
-    print(f"✅ Provider logged in successfully. Token: {token[:20]}...")
-    return token
-
-def test_availability_creation(provider_token: str) -> Dict[str, Any]:
-    """Create availability slots for the provider"""
-    print("📅 Creating provider availability...")
-    
-    availability_data = {
-        "date": (date.today() + timedelta(days=7)).isoformat(),  # Next week
+    if VERBOSE:
+        return print_response(response, title).get("data")
+    log.info("%s: %s (%dB)", title, response.status_code, len(response.content))
+    return orjson.loads(response.content).get("data")
+
+def build_availability_data(slot_date: str, recur_end: str) -> Dict[str, Any]:
+    """Build the availability payload for the demo provider"""
+    return {
+        "date": slot_date,  # Next week
         "start_time": "09:00",
         "end_time": "17:00",
         "timezone": "America/New_York",
@@ -88,7 +168,7 @@ def test_availability_creation(provider_token: str) -> Dict[str, Any]:
         "break_duration": 15,
         "is_recurring": True,
         "recurrence_pattern": "weekly",
-        "recurrence_end_date": (date.today() + timedelta(weeks=4)).isoformat(),
+        "recurrence_end_date": recur_end,
         "appointment_type": "consultation",
         "location": {
             "type": "clinic",
@@ -103,98 +183,96 @@ def test_availability_creation(provider_token: str) -> Dict[str, Any]:
         "special_requirements": ["bring_insurance_card", "fasting_required"],
         "notes": "Cardiology consultation slots"
     }
-    
-    headers = {"Authorization": f"Bearer {provider_token}"}
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/provider/availability", json=availability_data, headers=headers)
-    print_response(response, "Availability Creation")
-    
+
+async def test_provider_setup(public: httpx.AsyncClient, slot_date: str, recur_end: str):
+    """Register and login the provider, then create availability.
+
+    The login POST and the availability POST run back to back with no
+    logging or payload construction between them, so the second request
+    goes out as soon as the token is in hand; both responses are logged
+    once the pipeline has drained.
+    """
+    print("🔧 Registering provider...")
+
+    availability_bytes = orjson.dumps(build_availability_data(slot_date, recur_end))
+
+    response = await public.post(AUTH_REGISTER_URL, content=PROVIDER_DATA_BYTES)
+    # /auth/register returns the provider payload flat, with no "data"
+    # wrapper, so branch on the status alone instead of going through _ok
     if response.status_code != 201:
+        print_response(response, "Provider Registration [FAIL]")
+        print("❌ Provider registration failed")
+        return None, None
+    log.info("Provider Registration: %s (%dB)", response.status_code, len(response.content))
+
+    # Login and create availability as one authenticated pipeline
+    print("🔑 Logging in provider and creating availability...")
+    login_response = await public.post(PROVIDER_LOGIN_URL, content=PROVIDER_LOGIN_BYTES)
+    if login_response.status_code != 200:
+        print_response(login_response, "Provider Login")
+        print("❌ Provider login failed")
+        return None, None
+
+    login_body = orjson.loads(login_response.content)
+    token = login_body["data"]["access_token"]
+    provider_client = make_client(token)
+    availability_response = await provider_client.post(AVAILABILITY_URL, content=availability_bytes)
+
+    # Both responses have landed; now do the logging
+    print_response(login_response, "Provider Login", login_body)
+    print(f"✅ Provider logged in successfully. Token: {token[:20]}...")
+    data = _ok(availability_response, "Availability Creation", expect=201)
+
+    if data is None:
         print("❌ Availability creation failed")
-        return None
-    
-    return response.json()["data"]
 
-def test_patient_registration_and_login() -> str:
-    """Register a patient and login to get JWT token"""
+    return provider_client, data
+
+async def test_patient_registration_and_login(public: httpx.AsyncClient) -> httpx.AsyncClient:
+    """Register a patient and login, returning an authenticated client"""
     print("👤 Registering patient...")
-    
-    patient_data = {
-        "first_name": "John",
-        "last_name": "Smith",
-        "email": "john.smith@email.com",
-        "phone_number": "+1987654321",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!",
-        "date_of_birth": "1985-06-15",
-        "gender": "male",
-        "address": {
-            "street": "123 Main Street",
-            "city": "Boston",
-            "state": "MA",
-            "zip": "02101"
-        },
-        "emergency_contact": {
-            "name": "Jane Smith",
-            "phone": "+1987654322",
-            "relationship": "spouse"
-        },
-        "insurance_info": {
-            "provider": "Blue Cross Blue Shield",
-            "policy_number": "BCBS123456789"
-        }
-    }
-    
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/patient/register", json=patient_data)
-    print_response(response, "Patient Registration")
-    
-    if response.status_code != 201:
+
+    response = await public.post(PATIENT_REGISTER_URL, content=PATIENT_DATA_BYTES)
+    if _ok(response, "Patient Registration", expect=201) is None:
         print("❌ Patient registration failed")
         return None
-    
+
     # Login to get JWT token
     print("🔑 Logging in patient...")
-    login_data = {
-        "email": "john.smith@email.com",
-        "password": "SecurePass123!"
-    }
-    
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/patient/login", json=login_data)
-    print_response(response, "Patient Login")
-    
-    if response.status_code != 200:
+    response = await public.post(PATIENT_LOGIN_URL, content=PATIENT_LOGIN_BYTES)
+    data = _ok(response, "Patient Login")
+
+    if data is None:
         print("❌ Patient login failed")
         return None
-    
-    token = response.json()["data"]["access_token"]
+
+    token = data["access_token"]
     print(f"✅ Patient logged in successfully. Token: {token[:20]}...")
-    return token
+    return make_client(token)
 
-def test_availability_search() -> Dict[str, Any]:
+async def test_availability_search(public: httpx.AsyncClient, slot_date: str) -> Dict[str, Any]:
     """Search for available appointment slots"""
     print("🔍 Searching for available slots...")
-    
+
     search_params = {
-        "date": (date.today() + timedelta(days=7)).isoformat(),
+        "date": slot_date,
         "specialization": "cardiology",
         "appointment_type": "consultation",
         "insurance_accepted": True,
         "max_price": 250,
         "timezone": "America/New_York"
     }
-    
-    response = requests.get(f"{BASE_URL}{API_PREFIX}/provider/availability/search", params=search_params)
-    print_response(response, "Availability Search")
-    
-    if response.status_code != 200:
+
+    response = await public.get(AVAILABILITY_SEARCH_URL, params=search_params)
+    data = _ok(response, "Availability Search")
+    if data is None:
         print("❌ Availability search failed")
-        return None
-    
-    return response.json()["data"]
+    return data
 
-def test_appointment_booking(patient_token: str, slot_id: str) -> Dict[str, Any]:
+async def test_appointment_booking(patient_client: httpx.AsyncClient, slot_id: str) -> Dict[str, Any]:
     """Book an appointment"""
     print("📋 Booking appointment...")
-    
+
     appointment_data = {
         "slot_id": slot_id,
         "appointment_type": "consultation",
@@ -204,151 +282,168 @@ def test_appointment_booking(patient_token: str, slot_id: str) -> Dict[str, Any]
         "insurance_coverage": 150.00,
         "patient_payment": 50.00
     }
-    
-    headers = {"Authorization": f"Bearer {patient_token}"}
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/appointments", json=appointment_data, headers=headers)
-    print_response(response, "Appointment Booking")
-    
-    if response.status_code != 201:
+
+    response = await patient_client.post(APPOINTMENTS_URL, json=appointment_data)
+    data = _ok(response, "Appointment Booking", expect=201)
+    if data is None:
         print("❌ Appointment booking failed")
-        return None
-    
-    return response.json()["data"]
+    return data
 
-def test_appointment_management(patient_token: str, appointment_id: str):
+async def test_appointment_management(patient_client: httpx.AsyncClient, appointment_id: str):
     """Test appointment management operations"""
-    headers = {"Authorization": f"Bearer {patient_token}"}
-    
-    # Get appointment details
-    print("📖 Getting appointment details...")
-    response = requests.get(f"{BASE_URL}{API_PREFIX}/appointments/{appointment_id}", headers=headers)
-    print_response(response, "Get Appointment Details")
-    
-    # Update appointment details
+    # The booking response already carries the full record, so only hit the
+    # details endpoint when the cache has nothing for this appointment
+    record = APPOINTMENT_CACHE.get(appointment_id)
+    if record is not None:
+        print("📖 Reusing cached appointment details...")
+        listing = await patient_client.get(APPOINTMENTS_URL)
+    else:
+        # The two reads are independent of each other, so issue them concurrently
+        print("📖 Getting appointment details and all patient appointments...")
+        details, listing = await asyncio.gather(
+            patient_client.get(appointment_url(appointment_id)),
+            patient_client.get(APPOINTMENTS_URL)
+        )
+        details_data = _ok(details, "Get Appointment Details")
+        if details_data is not None:
+            APPOINTMENT_CACHE[appointment_id] = details_data
+    _ok(listing, "Get All Patient Appointments")
+
+    # Update appointment details (mutates server state, so stays sequenced)
     print("✏️ Updating appointment details...")
     update_data = {
         "symptoms": "Chest pain, shortness of breath, and fatigue"
     }
-    response = requests.put(f"{BASE_URL}{API_PREFIX}/appointments/{appointment_id}", json=update_data, headers=headers)
-    print_response(response, "Update Appointment Details")
-    
-    # Get all patient appointments
-    print("📋 Getting all patient appointments...")
-    response = requests.get(f"{BASE_URL}{API_PREFIX}/appointments", headers=headers)
-    print_response(response, "Get All Patient Appointments")
-
-def test_provider_appointment_management(provider_token: str):
+    response = await patient_client.put(appointment_url(appointment_id), json=update_data)
+    # The PUT echoes the updated record; refresh the cache from it instead
+    # of issuing a follow-up GET
+    updated = _ok(response, "Update Appointment Details")
+    if updated is not None:
+        APPOINTMENT_CACHE[appointment_id] = updated
+
+async def test_provider_appointment_management(provider_client: httpx.AsyncClient):
     """Test provider appointment management operations"""
-    headers = {"Authorization": f"Bearer {provider_token}"}
-    
     # Get provider appointments
     print("👨‍⚕️ Getting provider appointments...")
-    response = requests.get(f"{BASE_URL}{API_PREFIX}/provider/appointments", headers=headers)
-    print_response(response, "Get Provider Appointments")
-    
-    if response.status_code == 200 and response.json()["data"]:
-        appointment_id = response.json()["data"][0]["id"]
-        
+    response = await provider_client.get(PROVIDER_APPOINTMENTS_URL)
+    data = _ok(response, "Get Provider Appointments")
+
+    if data:
+        appointment_id = data[0]["id"]
+
         # Update appointment status
         print("✏️ Updating appointment status...")
         update_data = {
             "status": "confirmed",
             "medical_notes": "Patient scheduled for cardiology consultation"
         }
-        response = requests.put(f"{BASE_URL}{API_PREFIX}/provider/appointments/{appointment_id}", json=update_data, headers=headers)
-        print_response(response, "Update Appointment Status")
+        response = await provider_client.put(f"{PROVIDER_APPOINTMENTS_URL}/{appointment_id}", json=update_data)
+        _ok(response, "Update Appointment Status")
 
-def test_appointment_cancellation(patient_token: str, appointment_id: str):
+async def test_appointment_cancellation(patient_client: httpx.AsyncClient, appointment_id: str):
     """Test appointment cancellation"""
     print("❌ Cancelling appointment...")
-    
+
     cancel_data = {
         "reason": "Schedule conflict - need to reschedule"
     }
-    
-    headers = {"Authorization": f"Bearer {patient_token}"}
-    response = requests.post(f"{BASE_URL}{API_PREFIX}/appointments/{appointment_id}/cancel", json=cancel_data, headers=headers)
-    print_response(response, "Cancel Appointment")
 
-def test_public_appointment_lookup(booking_reference: str):
+    response = await patient_client.post(appointment_cancel_url(appointment_id), json=cancel_data)
+    _ok(response, "Cancel Appointment")
+
+async def test_public_appointment_lookup(public: httpx.AsyncClient, booking_reference: str):
     """Test public appointment lookup by booking reference"""
     print("🔍 Looking up appointment by booking reference...")
-    
-    response = requests.get(f"{BASE_URL}{API_PREFIX}/public/appointments/{booking_reference}")
-    print_response(response, "Public Appointment Lookup")
 
-def main():
+    response = await public.get(f"{PUBLIC_APPOINTMENTS_URL}/{booking_reference}")
+    _ok(response, "Public Appointment Lookup")
+
+async def main():
     """Main demo execution"""
     print("🏥 Healthcare Appointment Management Demo")
     print("=" * 60)
-    
+
+    provider_client = None
+    patient_client = None
+
+    # Compute the demo dates once so creation and search agree even if the
+    # run straddles midnight
+    today = date.today()
+    slot_date = (today + timedelta(days=7)).isoformat()
+    recur_end = (today + timedelta(weeks=4)).isoformat()
+
     try:
-        # Step 1: Provider registration and login
-        provider_token = test_provider_registration_and_login()
-        if not provider_token:
-            print("❌ Demo failed at provider registration")
-            return
-        
-        # Step 2: Create availability
-        availability_result = test_availability_creation(provider_token)
-        if not availability_result:
-            print("❌ Demo failed at availability creation")
-            return
-        
-        # Step 3: Patient registration and login
-        patient_token = test_patient_registration_and_login()
-        if not patient_token:
-            print("❌ Demo failed at patient registration")
-            return
-        
-        # Step 4: Search for available slots
-        search_result = test_availability_search()
-        if not search_result or not search_result["results"]:
-            print("❌ Demo failed at availability search")
-            return
-        
-        # Get first available slot
-        first_provider = search_result["results"][0]
-        if not first_provider["available_slots"]:
-            print("❌ No available slots found")
-            return
-        
-        slot_id = first_provider["available_slots"][0]["slot_id"]
-        print(f"✅ Found available slot: {slot_id}")
-        
-        # Step 5: Book appointment
-        appointment_result = test_appointment_booking(patient_token, slot_id)
-        if not appointment_result:
-            print("❌ Demo failed at appointment booking")
-            return
-        
-        appointment_id = appointment_result["id"]
-        booking_reference = appointment_result["booking_reference"]
-        
-        # Step 6: Test appointment management
-        test_appointment_management(patient_token, appointment_id)
-        
-        # Step 7: Test provider appointment management
-        test_provider_appointment_management(provider_token)
-        
-        # Step 8: Test public appointment lookup
-        test_public_appointment_lookup(booking_reference)
-        
-        # Step 9: Test appointment cancellation
-        test_appointment_cancellation(patient_token, appointment_id)
-        
-        print("🎉 Demo completed successfully!")
-        print("\n📊 Summary:")
-        print(f"   • Provider registered and logged in")
-        print(f"   • Availability created with {availability_result['slots_created']} slots")
-        print(f"   • Patient registered and logged in")
-        print(f"   • Appointment booked: {booking_reference}")
-        print(f"   • All management operations tested")
-        
+        async with make_client() as public:
+            # Steps 1-3: provider setup (register + login + availability) and
+            # patient setup are independent, so overlap their round trips
+            (provider_client, availability_result), patient_client = await asyncio.gather(
+                test_provider_setup(public, slot_date, recur_end),
+                test_patient_registration_and_login(public)
+            )
+
+            if not provider_client:
+                print("❌ Demo failed at provider registration")
+                return
+            if not availability_result:
+                print("❌ Demo failed at availability creation")
+                return
+            if not patient_client:
+                print("❌ Demo failed at patient registration")
+                return
+
+            # Step 4: Search for available slots
+            search_result = await test_availability_search(public, slot_date)
+            if not search_result or not search_result["results"]:
+                print("❌ Demo failed at availability search")
+                return
+
+            # Get first available slot
+            first_provider = search_result["results"][0]
+            if not first_provider["available_slots"]:
+                print("❌ No available slots found")
+                return
+
+            slot_id = first_provider["available_slots"][0]["slot_id"]
+            print(f"✅ Found available slot: {slot_id}")
+
+            # Step 5: Book appointment
+            appointment_result = await test_appointment_booking(patient_client, slot_id)
+            if not appointment_result:
+                print("❌ Demo failed at appointment booking")
+                return
+
+            appointment_id = appointment_result["id"]
+            booking_reference = appointment_result["booking_reference"]
+            APPOINTMENT_CACHE[appointment_id] = appointment_result
+
+            # Steps 6-8: patient-side management, provider-side management
+            # and the public lookup touch different actors, so all three
+            # can overlap
+            await asyncio.gather(
+                test_appointment_management(patient_client, appointment_id),
+                test_provider_appointment_management(provider_client),
+                test_public_appointment_lookup(public, booking_reference)
+            )
+
+            # Step 9: Test appointment cancellation
+            await test_appointment_cancellation(patient_client, appointment_id)
+
+            print("🎉 Demo completed successfully!")
+            print("\n📊 Summary:")
+            print(f"   • Provider registered and logged in")
+            print(f"   • Availability created with {availability_result['slots_created']} slots")
+            print(f"   • Patient registered and logged in")
+            print(f"   • Appointment booked: {booking_reference}")
+            print(f"   • All management operations tested")
+
     except Exception as e:
         print(f"❌ Demo failed with error: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        for client in (provider_client, patient_client):
+            if client:
+                await client.aclose()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
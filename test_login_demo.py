@@ -3,13 +3,37 @@
 Demo script for the new Provider Login functionality
 """
 
+import asyncio
 import json
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
+# Shared session so every call reuses pooled keep-alive connections
+# instead of paying a TCP handshake per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Hoisted so repeated calls don't re-run import machinery; the demo still
+# works when the app package (or jwt) isn't importable
+try:
+    import jwt
+    from app.config import settings
+except ImportError as _import_error:
+    jwt = None
+    settings = None
+    print(f"⚠️ JWT payload verification disabled: {_import_error}")
+
 def test_provider_login():
     """Test the new provider login endpoint"""
     
@@ -27,10 +51,9 @@ def test_provider_login():
     
     try:
         # Make the login request
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/v1/provider/login",
-            json=login_data,
-            headers={"Content-Type": "application/json"}
+            json=login_data
         )
         
         print(f"Status Code: {response.status_code}")
@@ -67,25 +90,25 @@ def test_provider_login():
             print()
             
             # Verify JWT token payload
-            import jwt
-            from app.config import settings
-            
-            try:
-                payload = jwt.decode(
-                    token_data['access_token'], 
-                    settings.secret_key, 
-                    algorithms=[settings.algorithm]
-                )
-                print("JWT Token Payload:")
-                print(f"  provider_id: {payload['provider_id']}")
-                print(f"  email: {payload['email']}")
-                print(f"  role: {payload['role']}")
-                print(f"  specialization: {payload['specialization']}")
-                print(f"  expires: {datetime.fromtimestamp(payload['exp'])}")
-                print()
-                
-            except Exception as e:
-                print(f"❌ JWT verification failed: {e}")
+            if jwt is None:
+                print("⚠️ Skipping JWT payload verification (jwt unavailable)")
+            else:
+                try:
+                    payload = jwt.decode(
+                        token_data['access_token'],
+                        settings.secret_key,
+                        algorithms=[settings.algorithm]
+                    )
+                    print("JWT Token Payload:")
+                    print(f"  provider_id: {payload['provider_id']}")
+                    print(f"  email: {payload['email']}")
+                    print(f"  role: {payload['role']}")
+                    print(f"  specialization: {payload['specialization']}")
+                    print(f"  expires: {datetime.fromtimestamp(payload['exp'])}")
+                    print()
+
+                except Exception as e:
+                    print(f"❌ JWT verification failed: {e}")
                 
         else:
             print("❌ Login Failed!")
@@ -126,21 +149,40 @@ def test_validation():
         }
     ]
     
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{BASE_URL}/api/v1/provider/login",
-                json=test_case["data"],
-                headers={"Content-Type": "application/json"}
+    # The cases are independent, so issue all POSTs concurrently instead of
+    # paying one round-trip per case
+    async def _run_cases():
+        limits = httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=60
+        )
+        # Bound in-flight requests so the burst respects server concurrency
+        sem = asyncio.Semaphore(4)
+
+        async with httpx.AsyncClient(limits=limits) as client:
+            async def _post(test_case):
+                async with sem:
+                    return await client.post(
+                        f"{BASE_URL}/api/v1/provider/login",
+                        json=test_case["data"]
+                    )
+
+            return await asyncio.gather(
+                *[_post(test_case) for test_case in test_cases],
+                return_exceptions=True
             )
-            
-            status = "✅" if response.status_code == test_case["expected_status"] else "❌"
-            print(f"{status} {test_case['name']}: {response.status_code}")
-            
-        except requests.exceptions.ConnectionError:
+
+    results = asyncio.run(_run_cases())
+
+    for test_case, result in zip(test_cases, results):
+        if isinstance(result, httpx.ConnectError):
             print(f"❌ {test_case['name']}: Connection failed")
-        except Exception as e:
-            print(f"❌ {test_case['name']}: {e}")
+        elif isinstance(result, Exception):
+            print(f"❌ {test_case['name']}: {result}")
+        else:
+            status = "✅" if result.status_code == test_case["expected_status"] else "❌"
+            print(f"{status} {test_case['name']}: {result.status_code}")
 
 if __name__ == "__main__":
     print("Starting Provider Login Demo...")
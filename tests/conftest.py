@@ -0,0 +1,56 @@
+import hashlib
+import hmac
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Point the models at SQLite before any app module reads the environment
+# (conftest imports before the test modules do): get_uuid_type chooses its
+# column type from DATABASE_URL at import time, and without it the schema
+# compiles postgres UUID columns that SQLite cannot render
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+# Reaches settings.bcrypt_rounds through pydantic-settings' case-insensitive
+# env lookup; cheapens the bcrypt calls that the sha256 stub doesn't cover
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app import crud, security
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run, entered so lifespan startup
+    (engine init, OpenAPI generation) happens once instead of per test."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _sha256_hash(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _sha256_verify(plain_password: str, hashed_password: str) -> bool:
+    return hmac.compare_digest(_sha256_hash(plain_password), hashed_password)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hash():
+    """Swap bcrypt for sha256 on the app's hashing seams for the test run.
+
+    The endpoint tests exercise validation, wiring, and response shape; KDF
+    strength is irrelevant there, and bcrypt dominates their CPU. Session
+    scope matters: class-scoped fixtures that seed accounts must hash with
+    the same function the tests later verify against. The real bcrypt path
+    stays covered by TestPasswordHashing in test_auth.py, which binds the
+    original functions at import time.
+    """
+    originals = (security.get_password_hash, security.verify_password,
+                 crud.get_password_hash)
+    security.get_password_hash = _sha256_hash
+    security.verify_password = _sha256_verify
+    # crud binds the function by name at import time, so patch it there too
+    crud.get_password_hash = _sha256_hash
+    yield
+    security.get_password_hash, security.verify_password, \
+        crud.get_password_hash = originals
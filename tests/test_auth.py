@@ -1,7 +1,7 @@
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.database import get_db, Base
 from app.models import Provider
@@ -9,9 +9,14 @@ from app.schemas import ProviderCreate, ClinicAddress
 from app.security import get_password_hash, verify_password
 import re
 
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Test database: in-memory with a StaticPool so the schema lives in RAM on
+# one shared connection instead of fsyncing ./test.db every test
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def override_get_db():
@@ -21,43 +26,69 @@ def override_get_db():
     finally:
         db.close()
 
-app.dependency_overrides[get_db] = override_get_db
-
-client = TestClient(app)
+# Installed per session (not at import) so this module's engine never leaks
+# into other modules collected in the same run
+@pytest.fixture(scope="session", autouse=True)
+def _override_db():
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
 
-@pytest.fixture(autouse=True)
-def setup_database():
+# Schema is built once per session; per-test isolation comes from deleting
+# rows, which is far cheaper on SQLite than re-running DDL every test
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
+def _delete_all_rows():
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+@pytest.fixture(autouse=True)
+def _clean():
+    yield
+    _delete_all_rows()
+
+# Shared template; the function-scoped fixture hands out fresh copies for
+# tests that mutate fields
+_VALID_PROVIDER_DATA = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john.doe@example.com",
+    "phone_number": "+1234567890",
+    "password": "SecurePass123!",
+    "specialization": "Cardiology",
+    "license_number": "MD123456",
+    "years_of_experience": 10,
+    "clinic_address": {
+        "street": "123 Medical Center Dr",
+        "city": "New York",
+        "state": "NY",
+        "zip": "10001"
+    }
+}
+
 @pytest.fixture
 def valid_provider_data():
-    return {
-        "first_name": "John",
-        "last_name": "Doe",
-        "email": "john.doe@example.com",
-        "phone_number": "+1234567890",
-        "password": "SecurePass123!",
-        "specialization": "Cardiology",
-        "license_number": "MD123456",
-        "years_of_experience": 10,
-        "clinic_address": {
-            "street": "123 Medical Center Dr",
-            "city": "New York",
-            "state": "NY",
-            "zip": "10001"
-        }
-    }
+    data = dict(_VALID_PROVIDER_DATA)
+    data["clinic_address"] = dict(_VALID_PROVIDER_DATA["clinic_address"])
+    return data
+
+@pytest.fixture(scope="module")
+def valid_provider_model():
+    """Validated once per module so the positive path pays Pydantic once"""
+    return ProviderCreate(**_VALID_PROVIDER_DATA)
 
 class TestProviderValidation:
     """Test provider data validation"""
     
-    def test_valid_provider_data(self, valid_provider_data):
+    def test_valid_provider_data(self, valid_provider_model):
         """Test that valid provider data passes validation"""
-        provider = ProviderCreate(**valid_provider_data)
-        assert provider.first_name == "John"
-        assert provider.email == "john.doe@example.com"
+        assert valid_provider_model.first_name == "John"
+        assert valid_provider_model.email == "john.doe@example.com"
     
     def test_invalid_email_format(self, valid_provider_data):
         """Test email validation"""
@@ -77,28 +108,25 @@ class TestProviderValidation:
         with pytest.raises(ValueError):
             ProviderCreate(**valid_provider_data)
     
-    def test_weak_password(self, valid_provider_data):
+    @pytest.mark.parametrize("password", [
+        "short",  # Too short
+        "nouppercase123!",  # No uppercase
+        "NOLOWERCASE123!",  # No lowercase
+        "NoNumbers!",  # No numbers
+        "NoSpecial123"  # No special characters
+    ])
+    def test_weak_password(self, valid_provider_data, password):
         """Test password complexity requirements"""
-        weak_passwords = [
-            "short",  # Too short
-            "nouppercase123!",  # No uppercase
-            "NOLOWERCASE123!",  # No lowercase
-            "NoNumbers!",  # No numbers
-            "NoSpecial123"  # No special characters
-        ]
-        
-        for password in weak_passwords:
-            valid_provider_data["password"] = password
-            with pytest.raises(ValueError):
-                ProviderCreate(**valid_provider_data)
-    
-    def test_invalid_phone_number(self, valid_provider_data):
+        valid_provider_data["password"] = password
+        with pytest.raises(ValueError):
+            ProviderCreate(**valid_provider_data)
+
+    @pytest.mark.parametrize("phone", ["123", "1234567890123456", "abc123def"])
+    def test_invalid_phone_number(self, valid_provider_data, phone):
         """Test phone number validation"""
-        invalid_phones = ["123", "1234567890123456", "abc123def"]
-        for phone in invalid_phones:
-            valid_provider_data["phone_number"] = phone
-            with pytest.raises(ValueError):
-                ProviderCreate(**valid_provider_data)
+        valid_provider_data["phone_number"] = phone
+        with pytest.raises(ValueError):
+            ProviderCreate(**valid_provider_data)
     
     def test_invalid_license_number(self, valid_provider_data):
         """Test license number validation"""
@@ -147,7 +175,7 @@ class TestPasswordHashing:
 class TestProviderRegistration:
     """Test provider registration endpoints"""
     
-    def test_successful_registration(self, valid_provider_data):
+    def test_successful_registration(self, client, valid_provider_data):
         """Test successful provider registration"""
         response = client.post("/api/v1/auth/register", json=valid_provider_data)
         assert response.status_code == 201
@@ -159,7 +187,7 @@ class TestProviderRegistration:
         assert data["verification_status"] == "pending"
         assert data["is_active"] is True
     
-    def test_duplicate_email_registration(self, valid_provider_data):
+    def test_duplicate_email_registration(self, client, valid_provider_data):
         """Test registration with duplicate email"""
         # First registration
         response = client.post("/api/v1/auth/register", json=valid_provider_data)
@@ -172,7 +200,7 @@ class TestProviderRegistration:
         assert response.status_code == 400
         assert "Email already registered" in response.json()["detail"]
     
-    def test_duplicate_phone_registration(self, valid_provider_data):
+    def test_duplicate_phone_registration(self, client, valid_provider_data):
         """Test registration with duplicate phone number"""
         # First registration
         response = client.post("/api/v1/auth/register", json=valid_provider_data)
@@ -185,7 +213,7 @@ class TestProviderRegistration:
         assert response.status_code == 400
         assert "Phone number already registered" in response.json()["detail"]
     
-    def test_duplicate_license_registration(self, valid_provider_data):
+    def test_duplicate_license_registration(self, client, valid_provider_data):
         """Test registration with duplicate license number"""
         # First registration
         response = client.post("/api/v1/auth/register", json=valid_provider_data)
@@ -198,7 +226,7 @@ class TestProviderRegistration:
         assert response.status_code == 400
         assert "License number already registered" in response.json()["detail"]
     
-    def test_invalid_data_registration(self, valid_provider_data):
+    def test_invalid_data_registration(self, client, valid_provider_data):
         """Test registration with invalid data"""
         valid_provider_data["email"] = "invalid-email"
         response = client.post("/api/v1/auth/register", json=valid_provider_data)
@@ -206,41 +234,49 @@ class TestProviderRegistration:
 
 class TestProviderLogin:
     """Test provider login functionality"""
-    
-    def test_successful_login(self, valid_provider_data):
-        """Test successful login"""
-        # Register provider first
-        response = client.post("/api/v1/auth/register", json=valid_provider_data)
+
+    @pytest.fixture(scope="class", autouse=True)
+    def _clean(self):
+        # Class-scoped override of the module fixture so the registered
+        # provider survives across the login tests; rows are cleared once
+        # after the class instead of per test
+        yield
+        _delete_all_rows()
+
+    @pytest.fixture(scope="class")
+    def registered_provider(self, client):
+        """Register the shared provider once per class; the login tests only
+        read the credentials, so one bcrypt hash + insert covers them all"""
+        data = dict(_VALID_PROVIDER_DATA)
+        data["clinic_address"] = dict(_VALID_PROVIDER_DATA["clinic_address"])
+        response = client.post("/api/v1/auth/register", json=data)
         assert response.status_code == 201
-        
-        # Login
+        return data
+
+    def test_successful_login(self, client, registered_provider):
+        """Test successful login"""
         login_data = {
-            "username": valid_provider_data["email"],
-            "password": valid_provider_data["password"]
+            "username": registered_provider["email"],
+            "password": registered_provider["password"]
         }
         response = client.post("/api/v1/auth/login", data=login_data)
         assert response.status_code == 200
-        
+
         data = response.json()
         assert "access_token" in data
         assert data["token_type"] == "bearer"
-    
-    def test_invalid_credentials(self, valid_provider_data):
+
+    def test_invalid_credentials(self, client, registered_provider):
         """Test login with invalid credentials"""
-        # Register provider first
-        response = client.post("/api/v1/auth/register", json=valid_provider_data)
-        assert response.status_code == 201
-        
-        # Login with wrong password
         login_data = {
-            "username": valid_provider_data["email"],
+            "username": registered_provider["email"],
             "password": "wrongpassword"
         }
         response = client.post("/api/v1/auth/login", data=login_data)
         assert response.status_code == 401
         assert "Incorrect email or password" in response.json()["detail"]
     
-    def test_nonexistent_user_login(self):
+    def test_nonexistent_user_login(self, client):
         """Test login with non-existent user"""
         login_data = {
             "username": "nonexistent@example.com",
@@ -1,107 +1,91 @@
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, Column, String, Integer, Boolean, DateTime, Enum, Date, ForeignKey
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.sql import func
-import enum
-import uuid
-from datetime import date, time, datetime, timedelta
+from sqlalchemy.pool import StaticPool
+from datetime import date, time, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from app.main import app
 from app.database import get_db, Base
-from app.models import (
-    Provider, Patient, ProviderAvailability, AppointmentSlot, 
-    AvailabilityStatus, AppointmentType, LocationType, RecurrencePattern
-)
-from app.security import get_password_hash
-import pytz
+from app.schemas import ProviderAvailabilityCreate
 from dateutil import rrule
 
-# Create test-specific models for SQLite compatibility
-class TestProvider(Base):
-    __tablename__ = "providers"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    first_name = Column(String(50), nullable=False)
-    last_name = Column(String(50), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    phone_number = Column(String(20), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    specialization = Column(String(100), nullable=False)
-    license_number = Column(String(50), unique=True, nullable=False, index=True)
-    years_of_experience = Column(Integer, nullable=True)
-    clinic_address = Column(String(500), nullable=False)  # JSON as string for SQLite
-    verification_status = Column(String(20), default="pending", nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
-
-
-class TestProviderAvailability(Base):
-    __tablename__ = "provider_availability"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    provider_id = Column(String(36), ForeignKey("providers.id"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
-    start_time = Column(String(5), nullable=False)  # HH:mm format
-    end_time = Column(String(5), nullable=False)  # HH:mm format
-    timezone = Column(String(50), nullable=False)
-    is_recurring = Column(Boolean, default=False, nullable=False)
-    recurrence_pattern = Column(String(20), nullable=True)
-    recurrence_end_date = Column(Date, nullable=True)
-    slot_duration = Column(Integer, default=30, nullable=False)  # minutes
-    break_duration = Column(Integer, default=0, nullable=False)  # minutes
-    status = Column(String(20), default="available", nullable=False)
-    max_appointments_per_slot = Column(Integer, default=1, nullable=False)
-    current_appointments = Column(Integer, default=0, nullable=False)
-    appointment_type = Column(String(20), default="consultation", nullable=False)
-    location = Column(String(500), nullable=False)  # JSON as string for SQLite
-    pricing = Column(String(500), nullable=True)  # JSON as string for SQLite
-    notes = Column(String(500), nullable=True)
-    special_requirements = Column(String(500), nullable=True)  # JSON as string for SQLite
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
-
-
-class TestAppointmentSlot(Base):
-    __tablename__ = "appointment_slots"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    availability_id = Column(String(36), ForeignKey("provider_availability.id"), nullable=False, index=True)
-    provider_id = Column(String(36), ForeignKey("providers.id"), nullable=False, index=True)
-    slot_start_time = Column(DateTime, nullable=False, index=True)
-    slot_end_time = Column(DateTime, nullable=False, index=True)
-    status = Column(String(20), default="available", nullable=False)
-    patient_id = Column(String(36), ForeignKey("patients.id"), nullable=True, index=True)
-    appointment_type = Column(String(50), nullable=False)
-    booking_reference = Column(String(100), unique=True, nullable=True, index=True)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
-
-
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_provider_availability.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Built once at import; ZoneInfo caches the parsed tz data process-wide,
+# unlike repeated pytz.timezone() lookups
+NY_TZ = ZoneInfo("America/New_York")
+
+# Test database: in-memory with a StaticPool so every connection (including
+# the TestClient's worker thread) shares the one RAM-backed DB instead of
+# journaling ./test_provider_availability.db on every insert. Because the
+# DB lives in process memory, each pytest-xdist worker process gets its own
+# isolated copy for free — no per-worker URL derivation needed
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+# Tests are the database's only user and durability is irrelevant, so turn
+# every safety knob off: journal and temp space stay in RAM, fsync is
+# skipped, the single writer keeps an exclusive lock, and the page cache is
+# sized (~20MB) to hold the whole dataset. Mostly no-ops for :memory: but
+# they keep the tests fast if the URL is ever pointed back at a file.
+@event.listens_for(engine, "connect")
+def _sqlite_fast_pragmas(dbapi_connection, connection_record):
+    # Stop pysqlite from managing transactions itself: it never opens one
+    # before a SAVEPOINT, which silently breaks the per-test rollback
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
 
-# Override the database dependency for testing
-app.dependency_overrides[get_db] = override_get_db
 
-client = TestClient(app)
+@event.listens_for(engine, "begin")
+def _sqlite_emit_begin(conn):
+    # With pysqlite's own transaction handling disabled above, BEGIN must
+    # be emitted explicitly
+    conn.exec_driver_sql("BEGIN")
 
-@pytest.fixture(autouse=True)
-def setup_database():
+# Schema is created once per session; per-test isolation comes from rolling
+# back an outer connection-level transaction instead of re-running DDL on
+# every test
+@pytest.fixture(scope="session")
+def _schema():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def db_session(_schema):
+    connection = engine.connect()
+    trans = connection.begin()
+    session = TestingSessionLocal(bind=connection)
+    session.begin_nested()
+
+    # Route commits land in a SAVEPOINT; reopen it whenever one ends so the
+    # outer transaction stays rollback-able
+    @event.listens_for(session, "after_transaction_end")
+    def _restart_savepoint(sess, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            sess.begin_nested()
+
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    event.remove(session, "after_transaction_end", _restart_savepoint)
+    session.close()
+    trans.rollback()
+    connection.close()
+
+@pytest.fixture(scope="module")
 def sample_provider():
     return {
         "first_name": "Dr. John",
@@ -120,23 +104,44 @@ def sample_provider():
         }
     }
 
-@pytest.fixture
-def registered_provider(sample_provider):
-    """Register a provider and return login token"""
-    # Register provider
-    response = client.post("/api/v1/auth/register", json=sample_provider)
-    assert response.status_code == 201
-    
-    # Login to get token
-    login_data = {
-        "email": sample_provider["email"],
-        "password": sample_provider["password"]
+@pytest.fixture(scope="module")
+def registered_provider(client, _schema, sample_provider):
+    """Register a provider once per module and cache the bearer token.
+
+    Registration and login are the most expensive calls the module makes
+    (password hash + verify), so they run once instead of per test. The
+    fixture commits through its own session; per-test rollbacks only undo
+    their own transaction, so the provider row survives across tests.
+    """
+    session = TestingSessionLocal()
+
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        # Register provider
+        response = client.post("/api/v1/auth/register", json=sample_provider)
+        assert response.status_code == 201
+
+        # Login to get token
+        login_data = {
+            "email": sample_provider["email"],
+            "password": sample_provider["password"]
+        }
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
+        assert response.status_code == 200
+
+        login_payload = response.json()["data"]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+    # Carry the provider id alongside the headers so tests never need a
+    # second login just to discover it
+    return {
+        "headers": {"Authorization": f"Bearer {login_payload['access_token']}"},
+        "provider_id": login_payload["provider"]["id"],
     }
-    response = client.post("/api/v1/provider/login", json=login_data)
-    assert response.status_code == 200
-    
-    token = response.json()["data"]["access_token"]
-    return {"Authorization": f"Bearer {token}"}
 
 @pytest.fixture
 def valid_availability_data():
@@ -149,7 +154,10 @@ def valid_availability_data():
         "break_duration": 15,
         "is_recurring": True,
         "recurrence_pattern": "weekly",
-        "recurrence_end_date": "2024-03-15",
+        # One extra week: the happy-path assertions only need some slots to
+        # exist, so the fixture keeps slot generation small. The full-month
+        # range lives in the slow-marked recurring test.
+        "recurrence_end_date": "2024-02-22",
         "appointment_type": "consultation",
         "location": {
             "type": "clinic",
@@ -167,68 +175,70 @@ def valid_availability_data():
 
 class TestAvailabilityValidation:
     """Test availability data validation"""
-    
+
     def test_valid_availability_data(self, valid_availability_data):
         """Test that valid availability data passes validation"""
-        from app.schemas import ProviderAvailabilityCreate
         availability = ProviderAvailabilityCreate(**valid_availability_data)
         assert availability.date == date(2024, 2, 15)
         assert availability.start_time == "09:00"
         assert availability.end_time == "17:00"
         assert availability.timezone == "America/New_York"
-    
+
     def test_invalid_time_format(self, valid_availability_data):
         """Test time format validation"""
-        valid_availability_data["start_time"] = "25:00"  # Invalid hour
-        from app.schemas import ProviderAvailabilityCreate
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
-    
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"start_time": "25:00"})
+            )
+
     def test_end_time_before_start_time(self, valid_availability_data):
         """Test end time must be after start time"""
-        valid_availability_data["end_time"] = "08:00"  # Before start time
-        from app.schemas import ProviderAvailabilityCreate
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
-    
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"end_time": "08:00"})
+            )
+
     def test_invalid_slot_duration(self, valid_availability_data):
         """Test slot duration validation"""
-        valid_availability_data["slot_duration"] = 10  # Too short
-        from app.schemas import ProviderAvailabilityCreate
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
-    
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"slot_duration": 10})
+            )
+
     def test_invalid_recurrence_end_date(self, valid_availability_data):
         """Test recurrence end date validation"""
-        valid_availability_data["recurrence_end_date"] = "2024-02-10"  # Before start date
-        from app.schemas import ProviderAvailabilityCreate
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
-    
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"recurrence_end_date": "2024-02-10"})
+            )
+
     def test_invalid_currency(self, valid_availability_data):
         """Test currency validation"""
-        valid_availability_data["pricing"]["currency"] = "INVALID"
-        from app.schemas import ProviderAvailabilityCreate
+        bad_pricing = valid_availability_data["pricing"] | {"currency": "INVALID"}
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
-    
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"pricing": bad_pricing})
+            )
+
     def test_physical_location_requires_address(self, valid_availability_data):
         """Test that physical locations require address"""
-        valid_availability_data["location"]["type"] = "clinic"
-        valid_availability_data["location"]["address"] = None
-        from app.schemas import ProviderAvailabilityCreate
+        bad_location = valid_availability_data["location"] | {
+            "type": "clinic", "address": None
+        }
         with pytest.raises(ValueError):
-            ProviderAvailabilityCreate(**valid_availability_data)
+            ProviderAvailabilityCreate(
+                **(valid_availability_data | {"location": bad_location})
+            )
 
 class TestAvailabilityCreation:
     """Test availability slot creation"""
     
-    def test_successful_availability_creation(self, registered_provider, valid_availability_data):
+    def test_successful_availability_creation(self, client, registered_provider, valid_availability_data):
         """Test successful availability slot creation"""
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -248,18 +258,18 @@ class TestAvailabilityCreation:
         assert response_data["slots_created"] > 0
         assert response_data["total_appointments_available"] > 0
     
-    def test_availability_creation_unauthorized(self, valid_availability_data):
+    def test_availability_creation_unauthorized(self, client, valid_availability_data):
         """Test availability creation without authentication"""
         response = client.post("/api/v1/provider/availability", json=valid_availability_data)
         assert response.status_code == 401
     
-    def test_conflicting_availability(self, registered_provider, valid_availability_data):
+    def test_conflicting_availability(self, client, registered_provider, valid_availability_data):
         """Test conflict detection for overlapping time slots"""
         # Create first availability
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -271,12 +281,13 @@ class TestAvailabilityCreation:
         response = client.post(
             "/api/v1/provider/availability",
             json=conflicting_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 400
         assert "conflicts with existing availability" in response.json()["detail"]
     
-    def test_recurring_availability(self, registered_provider, valid_availability_data):
+    @pytest.mark.slow
+    def test_recurring_availability(self, client, registered_provider, valid_availability_data):
         """Test recurring availability creation"""
         # Set up weekly recurring availability
         valid_availability_data["is_recurring"] = True
@@ -286,7 +297,7 @@ class TestAvailabilityCreation:
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -301,23 +312,17 @@ class TestAvailabilityCreation:
 class TestAvailabilityRetrieval:
     """Test availability retrieval"""
     
-    def test_get_provider_availability(self, registered_provider, valid_availability_data):
+    def test_get_provider_availability(self, client, registered_provider, valid_availability_data):
         """Test retrieving provider availability"""
         # First create availability
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
-        # Get provider ID from login response
-        login_response = client.post("/api/v1/provider/login", json={
-            "email": "john.doe@clinic.com",
-            "password": "SecurePassword123!"
-        })
-        provider_data = login_response.json()["data"]["provider"]
-        provider_id = provider_data["id"]
+        provider_id = registered_provider["provider_id"]
         
         # Retrieve availability
         response = client.get(
@@ -326,7 +331,7 @@ class TestAvailabilityRetrieval:
                 "start_date": "2024-02-15",
                 "end_date": "2024-02-16"
             },
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 200
         
@@ -346,23 +351,17 @@ class TestAvailabilityRetrieval:
         assert "booked_slots" in summary
         assert "cancelled_slots" in summary
     
-    def test_get_availability_with_filters(self, registered_provider, valid_availability_data):
+    def test_get_availability_with_filters(self, client, registered_provider, valid_availability_data):
         """Test availability retrieval with filters"""
         # Create availability
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
-        # Get provider ID
-        login_response = client.post("/api/v1/provider/login", json={
-            "email": "john.doe@clinic.com",
-            "password": "SecurePassword123!"
-        })
-        provider_data = login_response.json()["data"]["provider"]
-        provider_id = provider_data["id"]
+        provider_id = registered_provider["provider_id"]
         
         # Retrieve with filters
         response = client.get(
@@ -374,20 +373,20 @@ class TestAvailabilityRetrieval:
                 "appointment_type": "consultation",
                 "timezone": "America/New_York"
             },
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 200
 
 class TestAvailabilityUpdate:
     """Test availability slot updates"""
     
-    def test_update_availability_slot(self, registered_provider, valid_availability_data):
+    def test_update_availability_slot(self, client, registered_provider, valid_availability_data):
         """Test updating an availability slot"""
         # Create availability first
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -406,7 +405,7 @@ class TestAvailabilityUpdate:
         response = client.put(
             f"/api/v1/provider/availability/{slot_id}",
             json=update_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         # This would fail in test since we don't have real slot ID, but structure is correct
         assert response.status_code in [200, 404]
@@ -414,13 +413,13 @@ class TestAvailabilityUpdate:
 class TestAvailabilityDeletion:
     """Test availability slot deletion"""
     
-    def test_delete_availability_slot(self, registered_provider, valid_availability_data):
+    def test_delete_availability_slot(self, client, registered_provider, valid_availability_data):
         """Test deleting an availability slot"""
         # Create availability first
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -429,7 +428,7 @@ class TestAvailabilityDeletion:
         response = client.delete(
             f"/api/v1/provider/availability/{slot_id}",
             params={"delete_recurring": False, "reason": "Test deletion"},
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         # This would fail in test since we don't have real slot ID, but structure is correct
         assert response.status_code in [200, 404]
@@ -437,13 +436,13 @@ class TestAvailabilityDeletion:
 class TestAvailabilitySearch:
     """Test availability search functionality"""
     
-    def test_search_availability(self, registered_provider, valid_availability_data):
+    def test_search_availability(self, client, registered_provider, valid_availability_data):
         """Test searching for available slots"""
         # Create availability first
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -470,13 +469,13 @@ class TestAvailabilitySearch:
         assert "total_results" in search_data
         assert "results" in search_data
     
-    def test_search_with_date_range(self, registered_provider, valid_availability_data):
+    def test_search_with_date_range(self, client, registered_provider, valid_availability_data):
         """Test search with date range"""
         # Create availability
         response = client.post(
             "/api/v1/provider/availability",
             json=valid_availability_data,
-            headers=registered_provider
+            headers=registered_provider["headers"]
         )
         assert response.status_code == 201
         
@@ -496,41 +495,28 @@ class TestTimezoneHandling:
     
     def test_timezone_conversion(self):
         """Test timezone conversion logic"""
-        from datetime import datetime
-        import pytz
-        
         # Test UTC to local timezone conversion
-        utc_time = datetime(2024, 2, 15, 14, 0, 0, tzinfo=pytz.UTC)
-        ny_tz = pytz.timezone("America/New_York")
-        ny_time = utc_time.astimezone(ny_tz)
-        
-        # Should be different due to timezone offset
-        assert utc_time != ny_time
-        
+        utc_time = datetime(2024, 2, 15, 14, 0, 0, tzinfo=timezone.utc)
+        ny_time = utc_time.astimezone(NY_TZ)
+
+        # Wall-clock reading differs due to timezone offset
+        assert utc_time.hour != ny_time.hour
+
         # Test local to UTC conversion
-        local_time = datetime(2024, 2, 15, 9, 0, 0)
-        localized = ny_tz.localize(local_time)
-        utc_converted = localized.astimezone(pytz.UTC)
-        
-        assert utc_converted.tzinfo == pytz.UTC
-    
+        localized = datetime(2024, 2, 15, 9, 0, 0, tzinfo=NY_TZ)
+        utc_converted = localized.astimezone(timezone.utc)
+
+        assert utc_converted.tzinfo == timezone.utc
+
     def test_daylight_saving_time(self):
         """Test daylight saving time handling"""
-        from datetime import datetime
-        import pytz
-        
-        # Test DST transition
-        ny_tz = pytz.timezone("America/New_York")
-        
         # Before DST (March 9, 2024)
-        before_dst = datetime(2024, 3, 9, 9, 0, 0)
-        before_dst_local = ny_tz.localize(before_dst)
-        
+        before_dst_local = datetime(2024, 3, 9, 9, 0, 0, tzinfo=NY_TZ)
+
         # After DST (March 10, 2024)
-        after_dst = datetime(2024, 3, 10, 9, 0, 0)
-        after_dst_local = ny_tz.localize(after_dst)
-        
-        # Times should be different due to DST
+        after_dst_local = datetime(2024, 3, 10, 9, 0, 0, tzinfo=NY_TZ)
+
+        # Offsets should be different due to DST
         assert before_dst_local.utcoffset() != after_dst_local.utcoffset()
 
 class TestConflictDetection:
@@ -538,24 +524,21 @@ class TestConflictDetection:
     
     def test_overlapping_time_slots(self):
         """Test detection of overlapping time slots"""
-        from datetime import datetime, time
-        
+        # Same-day slots compare as minutes from midnight, matching the
+        # integer overlap check in crud.create_provider_availability
         # Slot 1: 9:00-10:00
-        slot1_start = datetime.combine(date(2024, 2, 15), time(9, 0))
-        slot1_end = datetime.combine(date(2024, 2, 15), time(10, 0))
-        
+        slot1_start, slot1_end = 9 * 60, 10 * 60
+
         # Slot 2: 9:30-10:30 (overlaps)
-        slot2_start = datetime.combine(date(2024, 2, 15), time(9, 30))
-        slot2_end = datetime.combine(date(2024, 2, 15), time(10, 30))
-        
+        slot2_start, slot2_end = 9 * 60 + 30, 10 * 60 + 30
+
         # Check for overlap
         overlap = (slot1_start < slot2_end and slot1_end > slot2_start)
         assert overlap is True
-        
+
         # Slot 3: 10:00-11:00 (no overlap)
-        slot3_start = datetime.combine(date(2024, 2, 15), time(10, 0))
-        slot3_end = datetime.combine(date(2024, 2, 15), time(11, 0))
-        
+        slot3_start, slot3_end = 10 * 60, 11 * 60
+
         overlap = (slot1_start < slot3_end and slot1_end > slot3_start)
         assert overlap is False
 
@@ -586,18 +569,18 @@ class TestSlotGeneration:
     
     def test_recurrence_pattern_generation(self):
         """Test recurrence pattern generation"""
-        from datetime import date
-        
+        from datetime import date, datetime
+
         # Test weekly recurrence
         start_date = date(2024, 2, 15)  # Thursday
         end_date = date(2024, 3, 15)
-        
-        # Generate weekly dates
-        weekly_dates = list(rrule.rrule(
-            rrule.WEEKLY,
-            dtstart=start_date,
-            until=end_date
-        ))
+
+        # Bound the rule with between() rather than materializing every
+        # occurrence of the rule; the window does the limiting
+        rr = rrule.rrule(rrule.WEEKLY, dtstart=start_date, until=end_date)
+        weekly_dates = rr.between(
+            datetime(2024, 2, 15), datetime(2024, 3, 15), inc=True
+        )
         
         # Should have multiple weeks
         assert len(weekly_dates) > 1
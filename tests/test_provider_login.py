@@ -1,65 +1,105 @@
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, Column, String, Integer, Boolean, DateTime, Enum
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.sql import func
-import enum
 import uuid
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable, CreateIndex
 from app.main import app
+from app import security
+from app.crud import get_provider_by_email
 from app.database import get_db, Base
-from app.models import Provider, VerificationStatus
-from app.security import get_password_hash, create_provider_access_token, verify_token_enhanced
-from app.schemas import ClinicAddress
+from app.models import Provider
+from app.security import create_provider_access_token, verify_token_enhanced
 import jwt
+import time
 from app.config import settings
 
-# Create test-specific model for SQLite compatibility
-class TestProvider(Base):
-    __tablename__ = "providers"
+# Test database: in-memory with a StaticPool so the TestClient worker
+# thread shares the one RAM-backed DB instead of journaling ./test_provider_login.db
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Durability is irrelevant for a throwaway test DB: keep the journal and
+# temp space in RAM, skip fsync, and hold the single-writer lock. Mostly
+# no-ops for :memory: but they matter on any fallback file-backed run.
+@event.listens_for(engine, "connect")
+def _sqlite_fast_pragmas(dbapi_connection, connection_record):
+    # Stop pysqlite from managing transactions itself: it never opens one
+    # before a SAVEPOINT, which silently breaks the per-test rollback
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    first_name = Column(String(50), nullable=False)
-    last_name = Column(String(50), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    phone_number = Column(String(20), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    specialization = Column(String(100), nullable=False)
-    license_number = Column(String(50), unique=True, nullable=False, index=True)
-    years_of_experience = Column(Integer, nullable=True)
-    clinic_address = Column(String(500), nullable=False)  # JSON as string for SQLite
-    verification_status = Column(
-        String(20), 
-        default=VerificationStatus.PENDING, 
-        nullable=False
-    )
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_provider_login.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(engine, "begin")
+def _sqlite_emit_begin(conn):
+    # With pysqlite's own transaction handling disabled above, BEGIN must
+    # be emitted explicitly
+    conn.exec_driver_sql("BEGIN")
 
-def override_get_db():
+
+# The schema DDL is compiled to a single script at import so the session
+# fixture can apply it with one executescript call, skipping create_all's
+# per-table existence PRAGMAs on the known-empty in-memory DB. Indexes are
+# emitted as separate statements — including the UNIQUE ones behind
+# Column(unique=True, index=True) — so the script matches what
+# Base.metadata.create_all would build.
+_SCHEMA_DDL = "\n".join(
+    str(ddl.compile(dialect=sqlite.dialect())) + ";"
+    for t in Base.metadata.sorted_tables
+    for ddl in (CreateTable(t), *map(CreateIndex, t.indexes))
+)
+
+# Schema is created once per session; per-test isolation comes from rolling
+# back an outer connection-level transaction instead of re-running DDL on
+# every test
+@pytest.fixture(scope="session")
+def _schema():
+    raw = engine.raw_connection()
     try:
-        db = TestingSessionLocal()
-        yield db
+        raw.driver_connection.executescript(_SCHEMA_DDL)
+        raw.commit()
     finally:
-        db.close()
+        raw.close()
+    # No drop_all teardown: the in-memory DB vanishes with the engine, and
+    # walking every table with DROP TABLE at session end bought nothing
 
-# Override the database dependency for testing
-app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(autouse=True)
+def db_session(_schema):
+    connection = engine.connect()
+    trans = connection.begin()
+    session = TestingSessionLocal(bind=connection)
+    session.begin_nested()
 
-client = TestClient(app)
+    # Route commits land in a SAVEPOINT; reopen it whenever one ends so the
+    # outer transaction stays rollback-able
+    @event.listens_for(session, "after_transaction_end")
+    def _restart_savepoint(sess, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            sess.begin_nested()
 
-@pytest.fixture(autouse=True)
-def setup_database():
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    event.remove(session, "after_transaction_end", _restart_savepoint)
+    session.close()
+    trans.rollback()
+    connection.close()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_provider_data():
     return {
         "first_name": "John",
@@ -78,24 +118,85 @@ def sample_provider_data():
         }
     }
 
-@pytest.fixture
-def registered_provider(sample_provider_data):
-    """Register a provider and return the data"""
-    response = client.post("/api/v1/auth/register", json=sample_provider_data)
-    assert response.status_code == 201
+@pytest.fixture(scope="session")
+def registered_provider(_schema, sample_provider_data):
+    """Seed the shared provider row once per session and return the data.
+
+    These tests exercise login, not registration, so the row is inserted
+    directly (with a string id and the active hasher's hash) instead of
+    going through the register endpoint. The row commits through the
+    fixture's own session; per-test rollbacks only undo their own
+    transaction, so it stays visible to every test.
+    """
+    session = TestingSessionLocal()
+    try:
+        session.add(Provider(
+            # String id: SQLite can't bind the column default's UUID object
+            id=str(uuid.uuid4()),
+            first_name=sample_provider_data["first_name"],
+            last_name=sample_provider_data["last_name"],
+            email=sample_provider_data["email"],
+            phone_number=sample_provider_data["phone_number"],
+            password_hash=security.get_password_hash(sample_provider_data["password"]),
+            specialization=sample_provider_data["specialization"],
+            license_number=sample_provider_data["license_number"],
+            years_of_experience=sample_provider_data["years_of_experience"],
+            clinic_address=sample_provider_data["clinic_address"],
+        ))
+        session.commit()
+    finally:
+        session.close()
     return sample_provider_data
 
+@pytest.fixture(scope="session")
+def provider_token(client, registered_provider):
+    """Log in once per session and cache the minted bearer token.
+
+    minted_at is recorded so the expiration test can measure the exp
+    claim against the moment the token was actually created rather than
+    whenever the test happens to run.
+    """
+    # Session scope means no per-test override is installed yet, so the
+    # fixture routes the login through its own session
+    session = TestingSessionLocal()
+
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        minted_at = int(time.time())
+        response = client.post("/api/v1/auth/provider/login", json={
+            "email": registered_provider["email"],
+            "password": registered_provider["password"]
+        })
+        assert response.status_code == 200
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+    return {
+        "token": response.json()["data"]["access_token"],
+        "minted_at": minted_at,
+    }
+
+@pytest.fixture(scope="session")
+def decoded_payload(provider_token):
+    """Decode the shared token once for the payload-inspection tests"""
+    return jwt.decode(
+        provider_token["token"], settings.secret_key, algorithms=[settings.algorithm]
+    )
+
 class TestProviderLoginEndpoint:
     """Test the new provider login endpoint"""
     
-    def test_successful_login(self, registered_provider):
+    def test_successful_login(self, client, registered_provider):
         """Test successful login with valid credentials"""
         login_data = {
             "email": registered_provider["email"],
             "password": registered_provider["password"]
         }
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -118,113 +219,84 @@ class TestProviderLoginEndpoint:
         assert "password" not in provider_data  # Password should not be returned
         assert "password_hash" not in provider_data
     
-    def test_invalid_email_format(self, registered_provider):
-        """Test login with invalid email format"""
-        login_data = {
-            "email": "invalid-email-format",
-            "password": registered_provider["password"]
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 422  # Validation error
-    
-    def test_empty_password(self, registered_provider):
-        """Test login with empty password"""
+    @pytest.mark.parametrize("overrides", [
+        pytest.param({"email": "invalid-email-format"}, id="invalid_email_format"),
+        pytest.param({"password": ""}, id="empty_password"),
+        pytest.param({"email": None}, id="missing_email"),
+        pytest.param({"password": None}, id="missing_password"),
+    ])
+    def test_invalid_login_payload(self, client, registered_provider, overrides):
+        """Test that malformed login payloads fail validation"""
         login_data = {
             "email": registered_provider["email"],
-            "password": ""
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 422  # Validation error
-    
-    def test_missing_email(self, registered_provider):
-        """Test login with missing email"""
-        login_data = {
-            "password": registered_provider["password"]
-        }
+            "password": registered_provider["password"],
+        } | overrides
+        # A None override means the field is omitted entirely
+        login_data = {k: v for k, v in login_data.items() if v is not None}
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 422  # Validation error
     
-    def test_missing_password(self, registered_provider):
-        """Test login with missing password"""
-        login_data = {
-            "email": registered_provider["email"]
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 422  # Validation error
-    
-    def test_incorrect_password(self, registered_provider):
+    def test_incorrect_password(self, client, registered_provider):
         """Test login with incorrect password"""
         login_data = {
             "email": registered_provider["email"],
             "password": "WrongPassword123!"
         }
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 401
         assert "Incorrect email or password" in response.json()["detail"]
     
-    def test_nonexistent_email(self, registered_provider):
+    def test_nonexistent_email(self, client, registered_provider):
         """Test login with non-existent email"""
         login_data = {
             "email": "nonexistent@clinic.com",
             "password": registered_provider["password"]
         }
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 401
         assert "Incorrect email or password" in response.json()["detail"]
     
-    def test_inactive_account(self, sample_provider_data):
+    def test_inactive_account(self, client, sample_provider_data, db_session):
         """Test login with inactive account"""
-        # Register provider
-        response = client.post("/api/v1/auth/register", json=sample_provider_data)
-        assert response.status_code == 201
-        
-        # Deactivate the provider (this would normally be done by admin)
-        # For testing, we'll simulate this by directly updating the database
-        from app.crud import get_provider_by_email
-        from app.database import SessionLocal
-        db = SessionLocal()
-        try:
-            provider = get_provider_by_email(db, sample_provider_data["email"])
-            if provider:
-                provider.is_active = False
-                db.commit()
-        finally:
-            db.close()
-        
+        # Seed an already-inactive account directly inside the test
+        # transaction; registering over HTTP and flipping the flag through
+        # a second session only added work for the same end state
+        db_session.add(Provider(
+            # String id: SQLite can't bind the column default's UUID object
+            id=str(uuid.uuid4()),
+            first_name=sample_provider_data["first_name"],
+            last_name=sample_provider_data["last_name"],
+            email="inactive@clinic.com",
+            phone_number="+1098765432",
+            password_hash=security.get_password_hash(sample_provider_data["password"]),
+            specialization=sample_provider_data["specialization"],
+            license_number="MD999999",
+            years_of_experience=sample_provider_data["years_of_experience"],
+            clinic_address=sample_provider_data["clinic_address"],
+            is_active=False,
+        ))
+        db_session.flush()
+
         # Try to login
         login_data = {
-            "email": sample_provider_data["email"],
+            "email": "inactive@clinic.com",
             "password": sample_provider_data["password"]
         }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
+
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 400
         assert "Account is inactive" in response.json()["detail"]
 
 class TestJWTTokenGeneration:
     """Test JWT token generation and validation"""
     
-    def test_jwt_token_payload(self, registered_provider):
+    def test_jwt_token_payload(self, registered_provider, decoded_payload):
         """Test that JWT token contains required payload fields"""
-        login_data = {
-            "email": registered_provider["email"],
-            "password": registered_provider["password"]
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 200
-        
-        token = response.json()["data"]["access_token"]
-        
-        # Decode and verify token payload
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        
+        payload = decoded_payload
+
         # Check required fields
         assert "sub" in payload  # email
         assert "provider_id" in payload
@@ -238,42 +310,15 @@ class TestJWTTokenGeneration:
         assert payload["role"] == "provider"
         assert payload["specialization"] == registered_provider["specialization"]
     
-    def test_jwt_token_expiration(self, registered_provider):
+    def test_jwt_token_expiration(self, provider_token, decoded_payload):
         """Test that JWT token expires after 1 hour"""
-        login_data = {
-            "email": registered_provider["email"],
-            "password": registered_provider["password"]
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 200
-        
-        token = response.json()["data"]["access_token"]
-        
-        # Decode token to check expiration
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        import time
-        current_time = int(time.time())
-        expiration_time = payload["exp"]
-        
-        # Token should expire in approximately 1 hour (3600 seconds)
-        time_until_expiry = expiration_time - current_time
+        # Token should expire approximately 1 hour (3600 seconds) after mint
+        time_until_expiry = decoded_payload["exp"] - provider_token["minted_at"]
         assert 3590 <= time_until_expiry <= 3610  # Allow 10 seconds tolerance
     
-    def test_enhanced_token_verification(self, registered_provider):
+    def test_enhanced_token_verification(self, registered_provider, provider_token):
         """Test enhanced token verification function"""
-        login_data = {
-            "email": registered_provider["email"],
-            "password": registered_provider["password"]
-        }
-        
-        response = client.post("/api/v1/provider/login", json=login_data)
-        assert response.status_code == 200
-        
-        token = response.json()["data"]["access_token"]
-        
-        # Test enhanced verification
-        token_data = verify_token_enhanced(token)
+        token_data = verify_token_enhanced(provider_token["token"])
         assert token_data is not None
         assert token_data["email"] == registered_provider["email"]
         assert token_data["role"] == "provider"
@@ -294,58 +339,43 @@ class TestJWTTokenGeneration:
 class TestAuthenticationLogic:
     """Test authentication logic and bcrypt password verification"""
     
-    def test_bcrypt_password_verification(self, registered_provider):
-        """Test that bcrypt password verification works correctly"""
-        from app.security import verify_password
-        from app.crud import get_provider_by_email
-        from app.database import SessionLocal
+    def test_bcrypt_password_verification(self, registered_provider, db_session):
+        """Test that password verification works correctly"""
+        # Looked up through the security module so the test uses whichever
+        # verifier is active (the suite-wide stub hashes the seeded rows)
+        provider = get_provider_by_email(db_session, registered_provider["email"])
+        
+        # Test correct password
+        assert security.verify_password(registered_provider["password"], provider.password_hash) is True
         
-        db = SessionLocal()
-        try:
-            provider = get_provider_by_email(db, registered_provider["email"])
-            
-            # Test correct password
-            assert verify_password(registered_provider["password"], provider.password_hash) is True
-            
-            # Test incorrect password
-            assert verify_password("WrongPassword123!", provider.password_hash) is False
-            
-        finally:
-            db.close()
+        # Test incorrect password
+        assert security.verify_password("WrongPassword123!", provider.password_hash) is False
     
-    def test_provider_access_token_creation(self, registered_provider):
+    def test_provider_access_token_creation(self, registered_provider, db_session):
         """Test provider-specific access token creation"""
-        from app.crud import get_provider_by_email
-        from app.database import SessionLocal
+        provider = get_provider_by_email(db_session, registered_provider["email"])
+        
+        # Create provider access token
+        token = create_provider_access_token(provider)
         
-        db = SessionLocal()
-        try:
-            provider = get_provider_by_email(db, registered_provider["email"])
-            
-            # Create provider access token
-            token = create_provider_access_token(provider)
-            
-            # Verify token payload
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-            assert payload["email"] == provider.email
-            assert payload["provider_id"] == str(provider.id)
-            assert payload["role"] == "provider"
-            assert payload["specialization"] == provider.specialization
-            
-        finally:
-            db.close()
+        # Verify token payload
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        assert payload["email"] == provider.email
+        assert payload["provider_id"] == str(provider.id)
+        assert payload["role"] == "provider"
+        assert payload["specialization"] == provider.specialization
 
 class TestLoginResponseFormat:
     """Test that login response matches the required format"""
     
-    def test_response_structure(self, registered_provider):
+    def test_response_structure(self, client, registered_provider):
         """Test that login response has the correct structure"""
         login_data = {
             "email": registered_provider["email"],
             "password": registered_provider["password"]
         }
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -374,14 +404,14 @@ class TestLoginResponseFormat:
         for field in required_provider_fields:
             assert field in provider_data
     
-    def test_sensitive_data_not_returned(self, registered_provider):
+    def test_sensitive_data_not_returned(self, client, registered_provider):
         """Test that sensitive data is not returned in login response"""
         login_data = {
             "email": registered_provider["email"],
             "password": registered_provider["password"]
         }
         
-        response = client.post("/api/v1/provider/login", json=login_data)
+        response = client.post("/api/v1/auth/provider/login", json=login_data)
         assert response.status_code == 200
         
         provider_data = response.json()["data"]["provider"]
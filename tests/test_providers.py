@@ -1,35 +1,137 @@
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+import uuid
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable, CreateIndex
 from app.main import app
+from app import security
 from app.database import get_db, Base
 from app.models import Provider, VerificationStatus
 from app.security import get_password_hash, create_access_token
 
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_providers.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Test database: in-memory with a StaticPool so the TestClient worker
+# thread shares the one RAM-backed DB instead of journaling ./test_providers.db
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
+# Durability is irrelevant for a throwaway test DB: keep the journal and
+# temp space in RAM, skip fsync, and hold the single-writer lock. Mostly
+# no-ops for :memory: but they matter on any fallback file-backed run.
+@event.listens_for(engine, "connect")
+def _sqlite_fast_pragmas(dbapi_connection, connection_record):
+    # Stop pysqlite from managing transactions itself: it never opens one
+    # before a SAVEPOINT, which silently breaks the per-test rollback
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _sqlite_emit_begin(conn):
+    # With pysqlite's own transaction handling disabled above, BEGIN must
+    # be emitted explicitly
+    conn.exec_driver_sql("BEGIN")
+
+
+# The schema DDL is compiled to a single script at import so the session
+# fixture can apply it with one executescript call, skipping create_all's
+# per-table existence PRAGMAs on the known-empty in-memory DB. Indexes are
+# emitted as separate statements — including the UNIQUE ones behind
+# Column(unique=True, index=True) — so the script matches what
+# Base.metadata.create_all would build.
+_SCHEMA_DDL = "\n".join(
+    str(ddl.compile(dialect=sqlite.dialect())) + ";"
+    for t in Base.metadata.sorted_tables
+    for ddl in (CreateTable(t), *map(CreateIndex, t.indexes))
+)
+
+# Schema is created once per session; per-test isolation comes from rolling
+# back an outer connection-level transaction instead of re-running DDL on
+# every test
+@pytest.fixture(scope="session")
+def _schema():
+    raw = engine.raw_connection()
     try:
-        db = TestingSessionLocal()
-        yield db
+        raw.driver_connection.executescript(_SCHEMA_DDL)
+        raw.commit()
     finally:
-        db.close()
+        raw.close()
+    # No drop_all teardown: the in-memory DB vanishes with the engine, and
+    # walking every table with DROP TABLE at session end bought nothing
+
+@pytest.fixture(autouse=True)
+def db_session(_schema):
+    connection = engine.connect()
+    trans = connection.begin()
+    session = TestingSessionLocal(bind=connection)
+    session.begin_nested()
 
-app.dependency_overrides[get_db] = override_get_db
+    # Route commits land in a SAVEPOINT; reopen it whenever one ends so the
+    # outer transaction stays rollback-able
+    @event.listens_for(session, "after_transaction_end")
+    def _restart_savepoint(sess, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            sess.begin_nested()
 
-client = TestClient(app)
+    def _override_get_db():
+        yield session
 
-@pytest.fixture(autouse=True)
-def setup_database():
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
+    app.dependency_overrides[get_db] = _override_get_db
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+    event.remove(session, "after_transaction_end", _restart_savepoint)
+    session.close()
+    trans.rollback()
+    connection.close()
+
+@pytest.fixture(scope="session")
+def _seeded_hash():
+    """Hash the sample password once with whatever hasher is active"""
+    return security.get_password_hash("SecurePass123!")
+
+def _seed_provider(db_session, password_hash, **overrides):
+    """Insert a provider row directly, skipping the HTTP registration path.
+
+    For tests that only need a row to exist, this avoids request parsing,
+    validation and password hashing entirely.
+    """
+    fields = {
+        # SQLite can't bind the UUID object the column default produces,
+        # so direct seeding must supply the id as a string itself
+        "id": str(uuid.uuid4()),
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "email": "jane.smith@example.com",
+        "phone_number": "+1987654321",
+        "password_hash": password_hash,
+        "specialization": "Neurology",
+        "license_number": "MD789012",
+        "years_of_experience": 15,
+        "clinic_address": {
+            "street": "456 Neurology Ave",
+            "city": "Los Angeles",
+            "state": "CA",
+            "zip": "90210"
+        },
+    }
+    fields.update(overrides)
+    provider = Provider(**fields)
+    db_session.add(provider)
+    db_session.flush()
+    return provider
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_provider_data():
     return {
         "first_name": "Jane",
@@ -48,28 +150,29 @@ def sample_provider_data():
         }
     }
 
-@pytest.fixture
-def authenticated_headers(sample_provider_data):
-    """Create authenticated headers for testing"""
-    # Register provider
-    response = client.post("/api/v1/auth/register", json=sample_provider_data)
-    assert response.status_code == 201
-    
-    # Login to get token
-    login_data = {
-        "username": sample_provider_data["email"],
-        "password": sample_provider_data["password"]
-    }
-    response = client.post("/api/v1/auth/login", data=login_data)
-    assert response.status_code == 200
-    
-    token = response.json()["access_token"]
+@pytest.fixture(scope="session")
+def authenticated_headers(_schema, _seeded_hash, sample_provider_data):
+    """Seed the provider and mint its bearer token directly, once per session.
+
+    Neither the registration nor the login endpoint is under test here, so
+    the fixture skips both HTTP round-trips and the password verify. The
+    row commits through the fixture's own session, so per-test rollbacks
+    (including the verify/reject mutations) leave it intact.
+    """
+    session = TestingSessionLocal()
+    try:
+        _seed_provider(session, _seeded_hash)
+        session.commit()
+    finally:
+        session.close()
+
+    token = create_access_token(data={"sub": sample_provider_data["email"]})
     return {"Authorization": f"Bearer {token}"}
 
 class TestProviderProfile:
     """Test provider profile endpoints"""
     
-    def test_get_current_provider_profile(self, authenticated_headers):
+    def test_get_current_provider_profile(self, client, authenticated_headers):
         """Test getting current provider's profile"""
         response = client.get("/api/v1/providers/me", headers=authenticated_headers)
         assert response.status_code == 200
@@ -81,13 +184,13 @@ class TestProviderProfile:
         assert data["verification_status"] == "pending"
         assert data["is_active"] is True
     
-    def test_get_profile_without_authentication(self):
+    def test_get_profile_without_authentication(self, client):
         """Test getting profile without authentication"""
         response = client.get("/api/v1/providers/me")
         assert response.status_code == 401
         assert "Not authenticated" in response.json()["detail"]
     
-    def test_get_profile_with_invalid_token(self):
+    def test_get_profile_with_invalid_token(self, client):
         """Test getting profile with invalid token"""
         headers = {"Authorization": "Bearer invalid_token"}
         response = client.get("/api/v1/providers/me", headers=headers)
@@ -97,7 +200,7 @@ class TestProviderProfile:
 class TestProviderVerification:
     """Test provider verification functionality"""
     
-    def test_get_provider_by_id(self, authenticated_headers, sample_provider_data):
+    def test_get_provider_by_id(self, client, authenticated_headers, sample_provider_data):
         """Test getting provider by ID"""
         # First get the provider's own profile to get the ID
         response = client.get("/api/v1/providers/me", headers=authenticated_headers)
@@ -113,40 +216,22 @@ class TestProviderVerification:
         assert data["first_name"] == "Jane"
         assert data["email"] == "jane.smith@example.com"
     
-    def test_get_nonexistent_provider(self, authenticated_headers):
+    def test_get_nonexistent_provider(self, client, authenticated_headers):
         """Test getting non-existent provider"""
         response = client.get("/api/v1/providers/nonexistent-id", headers=authenticated_headers)
         assert response.status_code == 404
         assert "Provider not found" in response.json()["detail"]
     
-    def test_verify_provider(self, authenticated_headers, sample_provider_data):
-        """Test verifying a provider"""
-        # First get the provider's own profile to get the ID
-        response = client.get("/api/v1/providers/me", headers=authenticated_headers)
-        assert response.status_code == 200
-        provider_id = response.json()["id"]
-        
-        # Verify the provider
-        verification_data = {"verification_status": "verified"}
-        response = client.put(
-            f"/api/v1/providers/{provider_id}/verify",
-            json=verification_data,
-            headers=authenticated_headers
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["verification_status"] == "verified"
-    
-    def test_reject_provider(self, authenticated_headers, sample_provider_data):
-        """Test rejecting a provider"""
+    @pytest.mark.parametrize("verification_status", ["verified", "rejected"])
+    def test_set_verification_status(self, client, authenticated_headers, verification_status):
+        """Test verifying and rejecting a provider"""
         # First get the provider's own profile to get the ID
         response = client.get("/api/v1/providers/me", headers=authenticated_headers)
         assert response.status_code == 200
         provider_id = response.json()["id"]
         
-        # Reject the provider
-        verification_data = {"verification_status": "rejected"}
+        # Set the verification status
+        verification_data = {"verification_status": verification_status}
         response = client.put(
             f"/api/v1/providers/{provider_id}/verify",
             json=verification_data,
@@ -155,9 +240,9 @@ class TestProviderVerification:
         assert response.status_code == 200
         
         data = response.json()
-        assert data["verification_status"] == "rejected"
+        assert data["verification_status"] == verification_status
     
-    def test_verify_nonexistent_provider(self, authenticated_headers):
+    def test_verify_nonexistent_provider(self, client, authenticated_headers):
         """Test verifying non-existent provider"""
         verification_data = {"verification_status": "verified"}
         response = client.put(
@@ -171,7 +256,7 @@ class TestProviderVerification:
 class TestPendingVerification:
     """Test pending verification functionality"""
     
-    def test_get_pending_verification_providers(self, authenticated_headers):
+    def test_get_pending_verification_providers(self, client, authenticated_headers):
         """Test getting providers pending verification"""
         response = client.get("/api/v1/providers/pending-verification", headers=authenticated_headers)
         assert response.status_code == 200
@@ -181,7 +266,7 @@ class TestPendingVerification:
         # Should include the current provider since they start with pending status
         assert len(data) >= 1
     
-    def test_get_pending_verification_without_auth(self):
+    def test_get_pending_verification_without_auth(self, client):
         """Test getting pending verification without authentication"""
         response = client.get("/api/v1/providers/pending-verification")
         assert response.status_code == 401
@@ -190,7 +275,7 @@ class TestPendingVerification:
 class TestProviderDataIntegrity:
     """Test data integrity and security"""
     
-    def test_password_not_returned_in_responses(self, authenticated_headers):
+    def test_password_not_returned_in_responses(self, client, authenticated_headers):
         """Test that passwords are never returned in API responses"""
         response = client.get("/api/v1/providers/me", headers=authenticated_headers)
         assert response.status_code == 200
@@ -200,17 +285,17 @@ class TestProviderDataIntegrity:
         assert "password" not in data
         assert "password_hash" not in data
     
-    def test_sensitive_data_protection(self, authenticated_headers, sample_provider_data):
+    def test_sensitive_data_protection(self, client, authenticated_headers, db_session, _seeded_hash):
         """Test that sensitive data is properly protected"""
-        # Register another provider
-        other_provider_data = sample_provider_data.copy()
-        other_provider_data["email"] = "other@example.com"
-        other_provider_data["phone_number"] = "+1111111111"
-        other_provider_data["license_number"] = "MD111111"
-        
-        response = client.post("/api/v1/auth/register", json=other_provider_data)
-        assert response.status_code == 201
-        other_provider_id = response.json()["id"]
+        # Seed another provider directly; this test reads it back through
+        # the API, so the registration endpoint need not be exercised again
+        other_provider = _seed_provider(
+            db_session, _seeded_hash,
+            email="other@example.com",
+            phone_number="+1111111111",
+            license_number="MD111111",
+        )
+        other_provider_id = str(other_provider.id)
         
         # Try to access other provider's data
         response = client.get(f"/api/v1/providers/{other_provider_id}", headers=authenticated_headers)